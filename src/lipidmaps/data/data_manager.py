@@ -1,10 +1,15 @@
 import csv
 import logging
 import re
-from typing import List, Tuple, Dict, Any, Union, Optional
+import sys
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, FrozenSet, Iterable, List, Tuple, Dict, Any, Union, Optional
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import networkx as nx
 from pydantic import BaseModel, Field, field_validator
 
 # import the data models we will produce
@@ -19,9 +24,62 @@ from .ingestion.csv_reader import CSVIngestion, CSVFormat
 from .validation.data_validator import DataValidator, ValidationReport
 from .utils.headgroups import lipidmaps_headgroups
 
+if TYPE_CHECKING:
+    # networkx is only needed by the reactions tree helpers, imported there
+    import networkx as nx
+
 
 logger = logging.getLogger(__name__)
 
+# Leading headgroup token of a lipid name, e.g. "PC" in "PC(16:0/18:1)"
+_HEADGROUP_RE = re.compile(r"^([A-Za-z0-9\-]+)")
+# Leading non-digit prefix of a sample id, e.g. "Control_" in "Control_01"
+_SAMPLE_GROUP_RE = re.compile(r"^(\D+)")
+# Reaction side attribute -> role stored on SampleReactionInfo
+_REACTION_ROLES = (("reactants", "reactant"), ("products", "product"))
+
+
+@lru_cache(maxsize=16384)
+def _headgroup_lm_id(lipid_name: str) -> Optional[str]:
+    """Return the class-level LM ID for the headgroup prefix of a lipid name.
+
+    Memoized because the same names recur across rows and repeated fills.
+    """
+    match = _HEADGROUP_RE.match(lipid_name)
+    if not match:
+        return None
+    lm_ids = lipidmaps_headgroups.get(match.group(1))
+    if lm_ids and lm_ids[0]:
+        return lm_ids[0]
+    return None
+
+
+def _float_column(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a column cell by cell with float().
+
+    Returns the values and a mask of the cells that parsed. Empty and
+    non-numeric cells are NaN and left out of the mask; a literal "NaN" cell
+    parses, so it stays in the mask with a NaN value.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.to_numpy(dtype=float)
+        return values, ~np.isnan(values)
+    cells = series.tolist()
+    try:
+        # numpy calls float() on each string; "nan" stands in for empty cells
+        text = [v or "nan" for v in cells] if "" in cells else cells
+        values = np.array(text, dtype=float)
+        return values, np.fromiter(map(bool, cells), dtype=bool, count=len(cells))
+    except (TypeError, ValueError):
+        values = np.full(len(cells), np.nan)
+        parsed = np.zeros(len(cells), dtype=bool)
+        for i, value in enumerate(cells):
+            try:
+                values[i] = float(value)
+            except (TypeError, ValueError):
+                continue
+            parsed[i] = True
+        return values, parsed
 
 
 class DataManager(BaseModel):
@@ -159,7 +217,9 @@ class DataManager(BaseModel):
         # logger.info(f"column_info: {column_info.get('column_types', {})}")
         # logger.info(f"Empty: {column_info.get('empty_columns', [])}")
         # Extract quantified lipids
-        quantified = self.extract_quantified_lipids(raw_df.rows, name_col, sample_ids, column_info)
+        # Prefer the parsed DataFrame; row dicts are never built here
+        source = raw_df.frame if raw_df.frame is not None else raw_df.rows
+        quantified = self.extract_quantified_lipids(source, name_col, sample_ids, column_info)
         self.annotate_lipids_with_refmet(quantified)
 
         dataset = LipidDataset(samples=samples_meta, lipids=quantified, column_info=column_info)
@@ -169,6 +229,58 @@ class DataManager(BaseModel):
         )
         return dataset
 
+    def process_csv_stream(
+        self, csv_path: Union[str, Path], chunksize: int = 100_000
+    ) -> LipidDataset:
+        """Like process_csv, but reads the file in chunks of ``chunksize`` rows.
+
+        QuantifiedLipids are accumulated chunk by chunk, so only one chunk of
+        raw cells is in memory at a time. Column types are guessed from the
+        first chunk (the guess samples at most 100 values per column, so it
+        matches process_csv unless the first chunk is smaller than that), and
+        no validation report is produced.
+
+        Args:
+            csv_path: Path to CSV file
+            chunksize: Maximum number of rows per chunk
+
+        Returns:
+            LipidDataset with processed data
+        """
+        csv_path = Path(csv_path)
+        logger.info(f"Streaming CSV file: {csv_path}")
+
+        ingestion = CSVIngestion(has_labels=self.has_labels)
+        quantified: List[QuantifiedLipid] = []
+        samples_meta: List[SampleMetadata] = []
+        name_col = None
+        sample_ids: List[str] = []
+        column_types: Dict[str, Any] = {}
+        for chunk in ingestion.read_csv_chunks(
+            csv_path, chunksize=chunksize, format_type=self.csv_format
+        ):
+            if chunk.is_empty():
+                continue
+            if name_col is None:
+                name_col = self._resolve_lipid_column(chunk.fieldnames)
+                sample_ids = self._resolve_sample_columns(chunk.fieldnames, name_col)
+                samples_meta = self.extract_sample_metadata(sample_ids, labels=chunk.labels)
+                column_types = ingestion.get_column_info(chunk)["column_types"]
+            quantified.extend(
+                self.extract_quantified_lipids(
+                    chunk.frame, name_col, sample_ids, {"column_types": column_types}
+                )
+            )
+
+        self.annotate_lipids_with_refmet(quantified)
+
+        dataset = LipidDataset(samples=samples_meta, lipids=quantified)
+        self.dataset = dataset
+        logger.info(
+            f"Created LipidDataset: {len(samples_meta)} samples, {len(quantified)} lipids"
+        )
+        return dataset
+
     def _resolve_lipid_column(self, fieldnames: List[str]) -> str:
         """Resolve the lipid name column from user specification or default.
 
@@ -211,14 +323,19 @@ class DataManager(BaseModel):
             lipid_col: The lipid name column (to exclude)
 
         Returns:
-            List of column names to use for sample data
+            List of column names to use for sample data. The names are
+            interned, so sample metadata and every lipid's values dict share
+            one key object per sample.
         """
         if self.sample_columns is None:
             # Default: all columns except lipid column
             return [
-                col for col in fieldnames if col != lipid_col and col and col.strip()
+                sys.intern(col)
+                for col in fieldnames
+                if col != lipid_col and col and col.strip()
             ]
 
+        known_columns = set(fieldnames)
         resolved = []
         for spec in self.sample_columns:
             if isinstance(spec, int):
@@ -232,7 +349,7 @@ class DataManager(BaseModel):
                     )
             else:
                 # Column name specified
-                if spec in fieldnames:
+                if spec in known_columns:
                     resolved.append(spec)
                 else:
                     raise ValueError(
@@ -240,7 +357,7 @@ class DataManager(BaseModel):
                         f"Available columns: {fieldnames}"
                     )
 
-        return [col for col in resolved if col and col.strip()]
+        return [sys.intern(col) for col in resolved if col and col.strip()]
 
 
     def extract_sample_metadata(self, sample_ids: List[str], labels: Optional[List[str]]=None) -> List[SampleMetadata]:
@@ -264,10 +381,10 @@ class DataManager(BaseModel):
             # Fall back to pattern extraction
             if not sample_id or not sample_id.strip():
                 return "unknown"
-            match = re.match(r"^(\D+)", sample_id)
+            match = _SAMPLE_GROUP_RE.match(sample_id)
             if match:
                 group = match.group(1).strip("_")
-                return group if group else "unknown"
+                return sys.intern(group) if group else "unknown"
             return "unknown"
 
         if labels:
@@ -295,53 +412,66 @@ class DataManager(BaseModel):
         return samples
 
     def extract_quantified_lipids(
-        self, rows: List[Dict], name_col: str, sample_ids: List[str], column_info: Optional[Dict[str, Any]] = None
+        self,
+        rows: Union[List[Dict], pd.DataFrame],
+        name_col: str,
+        sample_ids: List[str],
+        column_info: Optional[Dict[str, Any]] = None,
     ) -> List[QuantifiedLipid]:
-        """Extract QuantifiedLipid objects from CSV rows."""
+        """Extract QuantifiedLipid objects from CSV rows or a parsed DataFrame.
+
+        Sample columns are converted to one float matrix up front, parsing
+        each cell with float(); empty and non-numeric cells are left out of
+        each lipid's values, while a literal "NaN" cell is kept as NaN.
+        """
         logger.info(f"Extracting quantified lipids using name_col='{name_col}' and {sample_ids} samples")
         quantified = []
-        skipped_rows = 0
-        empty_columns = []
-        non_numeric_columns = []
+        # Sets, so filtering wide sample lists is linear rather than quadratic
+        excluded_columns = set()
 
         if column_info is not None:
-            empty_columns = column_info.get("empty_columns", [])
-            non_numeric_columns = [col for col, ctype in column_info.get("column_types", {}).items() if ctype != "numeric"]
-
-        
-        for row_idx, row in enumerate(rows, start=1):
-            lipid_name = (row.get(name_col) or "").strip()
-            if not lipid_name:
-                skipped_rows += 1
-                logger.info(f"Skipping row {row_idx}: empty lipid name")
-                continue
+            excluded_columns.update(column_info.get("empty_columns", []))
+            excluded_columns.update(
+                col for col, ctype in column_info.get("column_types", {}).items() if ctype != "numeric"
+            )
 
+        usable_ids = [sid for sid in sample_ids if sid not in excluded_columns]
+        if isinstance(rows, pd.DataFrame):
+            frame = rows
+        else:
+            columns = list(dict.fromkeys([name_col, *usable_ids]))
+            # Keys missing from a row read as empty cells
+            frame = pd.DataFrame.from_records(list(rows), columns=columns).fillna("")
+
+        names = frame[name_col].fillna("").astype(str).str.strip().tolist()
+        matrix = np.full((len(names), len(usable_ids)), np.nan)
+        present = np.zeros(matrix.shape, dtype=bool)
+        for j, sid in enumerate(usable_ids):
+            if sid in frame.columns:
+                matrix[:, j], present[:, j] = _float_column(frame[sid])
+        # Object array so the given sample id strings are reused as keys
+        ids = np.array(usable_ids, dtype=object)
+
+        # Rows without a name or without any value are dropped up front, so
+        # sparse files never build dicts for their blank rows
+        named = np.fromiter(map(bool, names), dtype=bool, count=len(names))
+        has_values = present.any(axis=1)
+        keep = named & has_values
+        skipped_rows = len(keep) - int(keep.sum())
+        if skipped_rows and logger.isEnabledFor(logging.INFO):
+            for idx in np.flatnonzero(~keep).tolist():
+                if not named[idx]:
+                    logger.info("Skipping row %d: empty lipid name", idx + 1)
+                else:
+                    logger.info("Skipping row %d: no valid values found", idx + 1)
 
-            values = {}
-            skipped_values = 0
-            for sid in sample_ids:
-                if sid in empty_columns or sid in non_numeric_columns:
-                    skipped_values += 1
-                    continue
-                raw = (row.get(sid) or "").strip()
-                if raw == "":
-                    skipped_values += 1
-                    continue
-                try:
-                    values[sid] = float(raw)
-                except ValueError:
-                    skipped_values += 1
-                    # logger.warning(
-                    #     f"Non-numeric value for sample {sid} at row {row_idx}: {raw!r}"
-                    # )
-                    continue
-            if values:
-                quantified.append(QuantifiedLipid(input_name=lipid_name, values=values))
-            else:
-                skipped_rows += 1
-                logger.info(f"Skipping row {row_idx}: no valid values found")
+        for idx in np.flatnonzero(keep).tolist():
+            mask = present[idx]
+            values = dict(zip(ids[mask].tolist(), matrix[idx, mask].tolist()))
+            # values are already floats keyed by sample id; skip re-validation
+            quantified.append(QuantifiedLipid.from_parsed(names[idx], values))
         if skipped_rows > 0:
-            logger.info(f"Total skipped rows: {skipped_rows}")
+            logger.info("Total skipped rows: %d", skipped_rows)
         return quantified
 
     def annotate_lipids_with_refmet(self, quantified: List[Any]) -> None:
@@ -356,29 +486,7 @@ class DataManager(BaseModel):
 
             # Apply results to quantified lipids
             for q, result in zip(quantified, refmet_results):
-                q.standardized_name = result.standardized_name
-                # record that the standardized name came from RefMet when present
-                try:
-                    if getattr(result, "standardized_name", None):
-                        q.standardized_by = "RefMet"
-                except Exception:
-                    pass
-
-                q.lm_id = result.lm_id
-                # if RefMet supplied the lm_id, record that source
-                try:
-                    if getattr(result, "lm_id", None):
-                        q.lm_id_found_by = "RefMet"
-                except Exception:
-                    pass
-                q.sub_class = result.sub_class
-                q.formula = result.formula
-                q.mass = result.exact_mass
-                q.super_class = result.super_class
-                q.main_class = result.main_class
-                q.chebi_id = result.chebi_id
-                q.kegg_id = result.kegg_id
-                q.refmet_id = result.refmet_id
+                q.apply_refmet(result)
         except Exception:
             logger.exception(
                 "RefMet annotation failed; continuing without standardized names"
@@ -404,9 +512,9 @@ class DataManager(BaseModel):
                 return 0
             quantified = self.dataset.lipids
 
-        # Collect indices and names for lipids missing lm_id
-        missing_indices: List[int] = []
-        query_names: List[str] = []
+        # Group indices of lipids missing lm_id by the name to query, so each
+        # distinct name is sent to LMSD once
+        name_to_indices: Dict[str, List[int]] = defaultdict(list)
         for i, q in enumerate(quantified):
             current = getattr(q, "lm_id", None)
             if not current:
@@ -417,9 +525,9 @@ class DataManager(BaseModel):
                     name = getattr(q, "input_name", None)
                 # ensure we have a name to query
                 if name:
-                    missing_indices.append(i)
-                    query_names.append(name)
+                    name_to_indices[name].append(i)
 
+        query_names = list(name_to_indices)
         if not query_names:
             logger.info("No missing lm_id entries to update via LMSD")
             return 0
@@ -441,12 +549,14 @@ class DataManager(BaseModel):
             return 0
 
         updated = 0
-        # Map results back to quantified list
-        for idx, item in zip(missing_indices, resp):
+        # Map results back to every lipid that shares the queried name
+        for name, item in zip(query_names, resp):
             if not isinstance(item, dict):
                 continue
             lm_id = item.get("lm_id")
-            if lm_id:
+            if not lm_id:
+                continue
+            for idx in name_to_indices[name]:
                 try:
                     quantified[idx].lm_id = lm_id
                     # Optionally record which field matched (if model supports it)
@@ -458,7 +568,7 @@ class DataManager(BaseModel):
                     except Exception:
                         pass
                 except Exception:
-                    logger.exception(f"Failed to set lm_id on lipid at index {idx}")
+                    logger.exception("Failed to set lm_id on lipid at index %s", idx)
                     continue
                 updated += 1
 
@@ -475,9 +585,12 @@ class DataManager(BaseModel):
         if dataset is None:
             dataset = getattr(self, "dataset", None)
 
-        # Record pre-existing lm_id state if we have a dataset
+        # Record pre-existing lm_id state if we have a dataset; only needed
+        # for the per-lipid report below, so skipped when INFO is disabled
+        logger = logging.getLogger(__name__)
+        report_each = logger.isEnabledFor(logging.INFO)
         pre_lm: Dict[str, Any] = {}
-        if dataset is not None and getattr(dataset, "lipids", None) is not None:
+        if report_each and dataset is not None and getattr(dataset, "lipids", None) is not None:
             pre_lm = {q.input_name: q.lm_id for q in dataset.lipids}
 
         # If we have an explicit dataset, pass its lipids list to the fill helper
@@ -487,14 +600,16 @@ class DataManager(BaseModel):
             updated_count = self.fill_missing_lm_ids_from_lmsd()
 
         # Logging/reporting: mirror previous CLI behavior
-        logger = logging.getLogger(__name__)
-        logger.info(f"LMSD fill completed: {updated_count} updated")
-        if updated_count and dataset is not None and getattr(dataset, "lipids", None) is not None:
+        logger.info("LMSD fill completed: %d updated", updated_count)
+        if report_each and updated_count and dataset is not None and getattr(dataset, "lipids", None) is not None:
             for q in dataset.lipids:
                 prev = pre_lm.get(q.input_name)
                 if not prev and q.lm_id:
                     logger.info(
-                        f"  {q.input_name} -> {q.lm_id} (matched_field={getattr(q, 'matched_field', None)})"
+                        "  %s -> %s (matched_field=%s)",
+                        q.input_name,
+                        q.lm_id,
+                        getattr(q, "matched_field", None),
                     )
 
         return updated_count
@@ -518,36 +633,86 @@ class DataManager(BaseModel):
         for lipid in dataset.lipids:
             if not getattr(lipid, "lm_id", None):
                 # Try to match headgroup by input_name prefix (e.g., 'PC(' matches 'PC')
-                match = re.match(r"^([A-Za-z0-9\-]+)", lipid.input_name)
-                if match:
-                    headgroup = match.group(1)
-                    lm_ids = lipidmaps_headgroups.get(headgroup)
-                    if lm_ids and lm_ids[0]:
-                        lipid.lm_id = lm_ids[0]
-                        lipid.lm_id_found_by = "headgroup"
-                        updated += 1
+                lm_id = _headgroup_lm_id(lipid.input_name)
+                if lm_id:
+                    lipid.lm_id = lm_id
+                    lipid.lm_id_found_by = "headgroup"
+                    updated += 1
         logger.info(f"Updated {updated} lm_id fields using headgroup mapping")
         return updated
 
-    def fetch_reactions_for_lm_ids(self, dataset: Optional[Any] = None) -> List[Any]:
+    def prefetch_reactions(
+        self, dataset: Optional[Any] = None
+    ) -> "Future[Tuple[FrozenSet[str], List[ReactionData]]]":
+        """
+        Start fetching reactions for the LM IDs known so far on a background thread.
+
+        Lets the reaction API calls overlap with later LM ID filling (LMSD,
+        headgroups). Pass the returned future to fetch_reactions_for_lm_ids,
+        which then only queries the LM IDs added in the meantime.
+        Args:
+            dataset: Optional LipidDataset to read LM IDs from. Defaults to self.dataset.
+        Returns:
+            Future resolving to (queried LM IDs, reactions retrieved for them).
+        """
+        lm_ids = frozenset(self._dataset_lm_ids(dataset))
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(lambda: (lm_ids, self._check_reactions(lm_ids)))
+        # Lets the worker thread exit once the fetch is done
+        executor.shutdown(wait=False)
+        return future
+
+    def fetch_reactions_for_lm_ids(
+        self,
+        dataset: Optional[Any] = None,
+        prefetched: Optional["Future[Tuple[FrozenSet[str], List[ReactionData]]]"] = None,
+    ) -> List[Any]:
         """
         Fetch Reaction objects for the given list of LM IDs using the ReactionChecker API.
         Args:
-            lm_ids: List of LM IDs to fetch reactions for.
+            dataset: Optional LipidDataset to read LM IDs from. Defaults to self.dataset.
+            prefetched: Optional future from prefetch_reactions; its reactions are
+                reused and only LM IDs it did not cover are queried.
         Returns:
             List of Reaction objects retrieved from the API.
         """
+        lm_ids = self._dataset_lm_ids(dataset)
+        reactions: List[ReactionData] = []
+        if prefetched is not None:
+            done_ids, reactions = prefetched.result()
+            lm_ids = [lm_id for lm_id in lm_ids if lm_id not in done_ids]
+            if not lm_ids:
+                return reactions
+
+        if not lm_ids:
+            logger.info("No LM IDs provided for reaction fetching.")
+            return []
+
+        if not reactions:
+            return self._check_reactions(lm_ids)
+
+        # A reaction linking a prefetched and a new LM ID is returned by both calls
+        seen = {r.reaction_id for r in reactions if r.reaction_id is not None}
+        merged = list(reactions)
+        for reaction in self._check_reactions(lm_ids):
+            if reaction.reaction_id is None or reaction.reaction_id not in seen:
+                merged.append(reaction)
+        return merged
+
+    def _dataset_lm_ids(self, dataset: Optional[Any] = None) -> List[str]:
+        """Return the LM IDs currently set on the lipids of `dataset`."""
         if dataset is None:
             dataset = self.dataset
         if dataset is None or not hasattr(dataset, "lipids"):
             logger.warning("No dataset or lipids to fetch reactions for.")
             return []
-        lm_ids = [lipid.lm_id for lipid in dataset.lipids if lipid.lm_id]
+        return [lipid.lm_id for lipid in dataset.lipids if lipid.lm_id]
 
+    def _check_reactions(self, lm_ids: Iterable[str]) -> List[ReactionData]:
+        """Query the reaction API for `lm_ids`, returning [] on failure."""
+        lm_ids = list(lm_ids)
         if not lm_ids:
-            logger.info("No LM IDs provided for reaction fetching.")
             return []
-
         try:
             checker = ReactionChecker(base_url="http://localhost")
             response = checker.check_reactions(lm_ids)
@@ -557,12 +722,16 @@ class DataManager(BaseModel):
         except Exception:
             logger.exception("Failed to fetch reactions from ReactionChecker API.")
             return []
-        
 
-    def annotate_lipids_with_reactions(self, reactions: list[ReactionData]) -> None:
+    def annotate_lipids_with_reactions(
+        self, reactions: list[ReactionData], keep_details: bool = False
+    ) -> None:
         """
         For each QuantifiedLipid in the dataset, find all reactions where the lipid's lm_id is a reactant or product,
         and update the QuantifiedLipid's 'reactions' field with a list of SampleReactionInfo summaries.
+
+        The full serialized reaction is only stored in each summary's ``details``
+        when ``keep_details`` is True, since it is otherwise copied per lipid.
         """
 
         if self.dataset is None or not hasattr(self.dataset, "lipids"):
@@ -570,7 +739,6 @@ class DataManager(BaseModel):
             return
 
         # Build a mapping from lm_id to list of QuantifiedLipid objects
-        from collections import defaultdict
         lm_id_to_lipids: dict[str, list[QuantifiedLipid]] = defaultdict(list)
         for lipid in self.dataset.lipids:
             lm_id = getattr(lipid, "lm_id", None)
@@ -594,11 +762,21 @@ class DataManager(BaseModel):
             enzyme_ids = getattr(reaction, "enzyme_ids", None)
             pathway_ids = getattr(reaction, "pathway_ids", None)
             # Additional details
-            details = reaction.model_dump() if hasattr(reaction, "model_dump") else dict(reaction)
+            if not keep_details:
+                details = None
+            elif hasattr(reaction, "model_dump"):
+                details = reaction.model_dump()
+            elif is_dataclass(reaction):
+                details = asdict(reaction)
+            else:
+                details = dict(reaction)
 
             # Check reactants and products for each reaction
-            for role in ["reactants", "products"]:
-                items = getattr(reaction, role, [])
+            for side, role in _REACTION_ROLES:
+                items = getattr(reaction, side, [])
+                # Identical for every lipid matched on this side of the
+                # reaction, so it is validated once and shared
+                info = None
                 for item in items:
                     lm_id = None
                     if isinstance(item, dict):
@@ -606,15 +784,16 @@ class DataManager(BaseModel):
                     elif hasattr(item, "compound_lm_id"):
                         lm_id = getattr(item, "compound_lm_id", None)
                     if lm_id and lm_id in lipid_reactions:
-                        info = SampleReactionInfo(
-                            reaction_id=reaction_id or "",
-                            reaction_name=reaction_name or "",
-                            type=rtype,
-                            enzyme_ids=enzyme_ids,
-                            pathway_ids=pathway_ids,
-                            role=role[:-1],  # "reactant" or "product"
-                            details=details,
-                        )
+                        if info is None:
+                            info = SampleReactionInfo(
+                                reaction_id=reaction_id or "",
+                                reaction_name=reaction_name or "",
+                                type=rtype,
+                                enzyme_ids=enzyme_ids,
+                                pathway_ids=pathway_ids,
+                                role=role,
+                                details=details,
+                            )
                         lipid_reactions[lm_id].append(info)
 
         # Assign the summary objects to each lipid (all with same lm_id)
@@ -623,28 +802,34 @@ class DataManager(BaseModel):
             for lipid in lipids:
                 lipid.reactions = rxns
 
-    def build_reactions_tree_from_reactions(self, reactions: list) -> nx.DiGraph:
+    def build_reactions_tree_from_reactions(self, reactions: list) -> "nx.DiGraph":
         """
         Build a directed graph (tree) of reactions from a list of ReactionData.
         Each node is a compound (by LM ID or name), edges represent reactions.
         """
+        import networkx as nx
+
         G = nx.DiGraph()
         for reaction in reactions:
             # Check for reactants/products attributes
             if hasattr(reaction, "reactants") and hasattr(reaction, "products"):
-                for reactant in reaction.reactants:
-                    for product in reaction.products:
-                        G.add_edge(
-                            reactant.display_name(),
-                            product.display_name(),
-                            reaction_id=getattr(reaction, "reaction_id", None),
-                            reaction_name=getattr(reaction, "reaction_name", None),
-                        )
+                # Names and edge attributes are resolved once per reaction,
+                # not once per reactant/product pair
+                product_names = [product.display_name() for product in reaction.products]
+                edge_attrs = {
+                    "reaction_id": getattr(reaction, "reaction_id", None),
+                    "reaction_name": getattr(reaction, "reaction_name", None),
+                }
+                G.add_edges_from(
+                    (reactant.display_name(), product_name, edge_attrs)
+                    for reactant in reaction.reactants
+                    for product_name in product_names
+                )
             else:
-                logger.warning(f"Reaction object missing reactants/products: {reaction}")
+                logger.warning("Reaction object missing reactants/products: %s", reaction)
         return G
     
-    def generate_pyplot_reactions_tree(self, tree: nx.DiGraph, output_path: Union[str, Path] = "reactions_tree.png") -> None:
+    def generate_pyplot_reactions_tree(self, tree: "nx.DiGraph", output_path: Union[str, Path] = "reactions_tree.png") -> None:
         """
         Generate and save a matplotlib plot of the reactions tree.
         Args:
@@ -652,6 +837,7 @@ class DataManager(BaseModel):
             output_path: Path to save the generated plot image.
         """
         import matplotlib.pyplot as plt
+        import networkx as nx
 
         plt.figure(figsize=(26, 12))  # Increase figure size for clarity
         pos = nx.spring_layout(tree, k=0.5, iterations=100)  # k controls spacing, increase for more space
@@ -690,18 +876,28 @@ class DataManager(BaseModel):
             else self.dataset.dict()
         )
 
+    def dataset_json(self) -> str:
+        """Serialize the dataset straight to a JSON string.
+
+        Cheaper than ``json.dumps(self.dataset_dict())`` since pydantic writes
+        the JSON without building the intermediate dicts.
+        """
+        if self.dataset is None:
+            return "{}"
+        return self.dataset.model_dump_json()
+
     # small helper to compute dataframe for quick analysis
     def dataset_as_dataframe(self) -> pd.DataFrame:
         """Return a pandas DataFrame with lipids as rows and samples as columns."""
         if self.dataset is None:
             return pd.DataFrame()
-        records = []
-        for q in self.dataset.lipids:
-            rec = {"lipid": q.input_name}
-            rec.update(q.values)
-            records.append(rec)
-        df = pd.DataFrame.from_records(records).set_index("lipid")
-        return df
+        # Columns follow the dataset's samples, as in LipidDataset.to_matrix
+        index = pd.Index([q.input_name for q in self.dataset.lipids], name="lipid")
+        return pd.DataFrame(
+            self.dataset.to_matrix(),
+            index=index,
+            columns=list(self.dataset.sample_columns()),
+        )
 
     def add_lipid_species(self, lipid: Any) -> None:
         """Add a lipid species to the manager (legacy helper used by tests).
@@ -740,35 +936,39 @@ class DataManager(BaseModel):
         if self.dataset is None:
             return {}
 
-        import numpy as np
-
-        # Group samples by their group attribute
-        groups: Dict[str, List[SampleMetadata]] = {}
+        # Group sample columns of the lipid x sample matrix by group
+        col_index = self.dataset.sample_columns()
+        groups: Dict[str, List[int]] = defaultdict(list)
         for sample in self.dataset.samples:
-            groups.setdefault(sample.group, []).append(sample)
+            groups[sample.group].append(col_index[sample.sample_id])
+
+        matrix = self.dataset.to_matrix()
+        # Presence comes from the value keys: a NaN value is still a value
+        # and makes that lipid's mean and std NaN
+        presence = self.dataset.presence_matrix()
+        names = [lipid.input_name for lipid in self.dataset.lipids]
 
         group_stats = {}
-        for group_name, samples in groups.items():
-            sample_ids = [s.sample_id for s in samples]
+        for group_name, columns in groups.items():
+            values = matrix[:, columns]
+            present = presence[:, columns]
+            counts = present.sum(axis=1)
+            covered = counts > 0
+            # Means and population stds over each lipid's present values only
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = np.where(present, values, 0.0).sum(axis=1) / counts
+                deviations = np.where(present, values - means[:, None], 0.0)
+                stds = np.sqrt((deviations ** 2).sum(axis=1) / counts)
 
             lipid_means = {}
             lipid_stds = {}
-            lipid_coverage = 0
-
-            for lipid in self.dataset.lipids:
-                # Extract values for this group's samples
-                group_values = [
-                    lipid.values.get(sid) for sid in sample_ids if sid in lipid.values
-                ]
-
-                if group_values:
-                    lipid_coverage += 1
-                    lipid_means[lipid.input_name] = float(np.mean(group_values))
-                    lipid_stds[lipid.input_name] = float(np.std(group_values))
+            for i in np.flatnonzero(covered):
+                lipid_means[names[i]] = float(means[i])
+                lipid_stds[names[i]] = float(stds[i])
 
             group_stats[group_name] = {
-                "sample_count": len(samples),
-                "lipid_coverage": lipid_coverage,
+                "sample_count": len(columns),
+                "lipid_coverage": int(covered.sum()),
                 "mean_values": lipid_means,
                 "std_values": lipid_stds,
             }
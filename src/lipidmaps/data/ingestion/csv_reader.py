@@ -8,15 +8,78 @@ Will support MS-DIAL
 
 import csv
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional, Union
+from typing import Iterable, Iterator, List, Dict, Any, TextIO, Tuple, Optional, Union
 from enum import Enum
 
-from pydantic import BaseModel, Field, computed_field
+import numpy as np
+import pandas as pd
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    model_serializer,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _ForwardHandler(logging.Handler):
+    """Hand records from worker processes to the logger they were sent to."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(log_queue: Any, level: int) -> None:
+    """Send a read_batch worker's log records back to the parent process.
+
+    Handlers inherited from the parent are dropped, so every record is
+    emitted once, by the parent's own handlers.
+    """
+    for existing in logging.Logger.manager.loggerDict.values():
+        if isinstance(existing, logging.Logger):
+            existing.handlers.clear()
+            existing.propagate = True
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _cell_string(value: Any) -> str:
+    """Normalize one cell to a stripped string; None becomes ""."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip()
+
+
+def _column_strings(series: pd.Series) -> List[str]:
+    """Render a parsed column back to cell strings; missing cells become ""."""
+    if series.dtype == object:
+        return series.fillna("").tolist()
+    return ["" if v != v else str(v) for v in series.tolist()]
+
+
+def _to_floats(cells: List[str]) -> np.ndarray:
+    """Parse cell strings to float64 as float() would; "" becomes NaN.
+
+    Raises ValueError if any other cell is not a number.
+    """
+    if "" in cells:
+        cells = [v or "nan" for v in cells]
+    return np.array(cells, dtype=np.float64)
+
+
 class CSVFormat(Enum):
     """Supported CSV formats."""
 
@@ -30,22 +93,105 @@ class RawDataFrame(BaseModel):
 
     Attributes:
         rows: List of dictionaries, one per data row
+        frame: Column data as a pandas DataFrame, one column per fieldname
         fieldnames: List of column headers
         format_type: Detected or specified format type
         labels: Optional list of labels from second row if present
         metadata: Additional metadata about the file
+
+    When ``frame`` is set, ``rows`` is only built from it on first access.
+    Columns read through ``column`` and ``numeric_column`` are built once and
+    cached.
     """
 
-    rows: List[Dict[str, str]] = Field(default_factory=list)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    frame: Optional[pd.DataFrame] = Field(default=None, exclude=True, repr=False)
     fieldnames: List[str] = Field(default_factory=list)
     labels: List[str] = Field(default_factory=list)
     format_type: CSVFormat
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    _rows: Optional[List[Dict[str, str]]] = PrivateAttr(default=None)
+    _columns: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _numeric: Dict[str, Optional[np.ndarray]] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, rows: Optional[List[Dict[str, str]]] = None, **data: Any):
+        super().__init__(**data)
+        self._rows = rows
+
+    @classmethod
+    def from_columns(
+        cls, fieldnames: List[str], columns: List[List[str]], **data: Any
+    ) -> "RawDataFrame":
+        """Build a RawDataFrame from one list of stripped cell strings per
+        fieldname. The lists also seed the ``column`` cache, so they are not
+        read back out of the frame.
+        """
+        # A repeated header keeps its last column, as a row dict would
+        by_name = dict(zip(fieldnames, columns))
+        raw_df = cls(frame=pd.DataFrame(by_name), fieldnames=fieldnames, **data)
+        raw_df._columns.update(by_name)
+        return raw_df
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def rows(self) -> List[Dict[str, str]]:
+        """Rows as dicts of stripped cell strings, keyed by fieldname."""
+        if self._rows is None:
+            if self.frame is None:
+                self._rows = []
+            else:
+                columns = [self.column(c) for c in self.fieldnames]
+                self._rows = [dict(zip(self.fieldnames, v)) for v in zip(*columns)]
+        return self._rows
+
+    def column(self, name: str) -> List[str]:
+        """Return the cell strings of one column, without building ``rows``.
+
+        Cells are stripped strings, with "" for missing or None values; frame
+        columns are already stripped at read time, and rows are normalized
+        here once. The list is cached and shared between callers; treat it as
+        read-only.
+        """
+        cells = self._columns.get(name)
+        if cells is None:
+            if self._rows is None and self.frame is not None:
+                cells = _column_strings(self.frame[name])
+            else:
+                cells = [_cell_string(row.get(name, "")) for row in self.rows]
+            self._columns[name] = cells
+        return cells
+
+    def numeric_column(self, name: str) -> Optional[np.ndarray]:
+        """Return a column parsed as float64, or None if a cell is not a number.
+
+        Cells from ``column`` are parsed with float(), so the result matches
+        converting them one by one; empty cells are NaN. Use ``column`` for
+        text columns.
+        """
+        if name not in self._numeric:
+            try:
+                parsed: Optional[np.ndarray] = _to_floats(self.column(name))
+            except ValueError:
+                parsed = None
+            self._numeric[name] = parsed
+        return self._numeric[name]
+
+    @model_serializer(mode="wrap")
+    def _serialize_rows_first(self, handler: Any) -> Any:
+        # Dumps keep "rows" first, where it was as a plain model field
+        data = handler(self)
+        if isinstance(data, dict) and "rows" in data:
+            data = {"rows": data.pop("rows"), **data}
+        return data
+
     @computed_field  # type: ignore[misc]
     @property
     def row_count(self) -> int:
         """Return number of data rows."""
+        if self._rows is None and self.frame is not None:
+            return len(self.frame)
         return len(self.rows)
 
     @computed_field  # type: ignore[misc]
@@ -56,7 +202,7 @@ class RawDataFrame(BaseModel):
 
     def is_empty(self) -> bool:
         """Check if data frame has no rows."""
-        return len(self.rows) == 0
+        return self.row_count == 0
 
 
 class CSVIngestion(BaseModel):
@@ -107,56 +253,54 @@ class CSVIngestion(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"CSV file not found: {path}")
 
+        # One prefix read serves both format and delimiter detection
+        sample = None
+        if format_type == CSVFormat.AUTO or self.delimiter is None:
+            sample = self._read_sniff_buffer(path)
+
         # Detect format if AUTO
         if format_type == CSVFormat.AUTO:
-            format_type = self.detect_format(path)
+            format_type = self.detect_format(path, sample)
             logger.info(f"Detected format: {format_type.value}")
 
         # Read based on format
         if format_type == CSVFormat.MSDIAL:
             return self.read_msdial(path)
         else:
-            return self.read_standard_csv(path)
+            return self.read_standard_csv(path, sample)
 
-    def read_standard_csv(self, path: Path) -> RawDataFrame:
+    def read_standard_csv(self, path: Path, sample: Optional[str] = None) -> RawDataFrame:
         """Read standard CSV file.
 
         Args:
             path: Path to CSV file
+            sample: Start of the file from _read_sniff_buffer, if already read
 
         Returns:
             RawDataFrame with parsed data
         """
         # Auto-detect delimiter if not specified
-        delimiter = self.delimiter or self._detect_delimiter(path)
+        delimiter = self.delimiter or self._detect_delimiter(path, sample)
         has_labels = self.has_labels
-        rows = []
-        fieldnames = []
-        labels = []
 
-        try:
-            with path.open("r", encoding=self.encoding, newline="") as file:
-                reader = csv.DictReader(file, delimiter=delimiter)
-                fieldnames = reader.fieldnames or []
-                rows = list(reader)
-                if has_labels:
-                    labels = [rows[0][fn] for fn in fieldnames]
-                    logger.info(f"Labels detected: {labels}")
-                    rows = rows[1:]
+        def read(encoding: str):
+            # One pass of the positional reader, which records short and long
+            # rows for the validator. Rows stream from the reader straight
+            # into per-column lists; blank lines are skipped.
+            with path.open("r", encoding=encoding, newline="") as file:
+                reader = csv.reader(file, delimiter=delimiter)
+                fieldnames, labels, rows_iter = self._read_header(reader, has_labels)
+                columns, row_structure_issues = self._sanitize_rows(fieldnames, rows_iter)
+            return fieldnames, labels, columns, row_structure_issues
 
+        try:
+            fieldnames, labels, columns, row_structure_issues = read(self.encoding)
         except UnicodeDecodeError:
             # Try alternative encoding
             logger.info(f"Failed to decode with {self.encoding}, trying latin-1")
-            with path.open("r", encoding="latin-1", newline="") as file:
-                reader = csv.DictReader(file, delimiter=delimiter)
-                fieldnames = reader.fieldnames or []
-                
-                rows = list(reader)
-                if has_labels:
-                    labels = [rows[0][fn] for fn in fieldnames]
-                    rows = rows[1:]
-
-        rows, row_structure_issues = self._sanitize_rows(fieldnames, rows)
+            fieldnames, labels, columns, row_structure_issues = read("latin-1")
+        if labels:
+            logger.info(f"Labels detected: {labels}")
 
         metadata = {
             "source_file": str(path),
@@ -166,17 +310,125 @@ class CSVIngestion(BaseModel):
             "row_structure_issues": row_structure_issues,
         }
 
-        logger.info(
-            f"Read {len(rows)} rows, {len(fieldnames)} columns from {path.name}"
-        )
-
-        return RawDataFrame(
-            rows=rows,
-            fieldnames=fieldnames,
+        result = RawDataFrame.from_columns(
+            fieldnames,
+            columns,
             format_type=CSVFormat.STANDARD,
             labels=labels,
             metadata=metadata,
         )
+        logger.info(
+            f"Read {result.row_count} rows, {len(fieldnames)} columns from {path.name}"
+        )
+        return result
+
+    def read_csv_chunks(
+        self,
+        path: Union[str, Path],
+        chunksize: int = 100_000,
+        format_type: CSVFormat = CSVFormat.AUTO,
+    ) -> Iterator[RawDataFrame]:
+        """Yield a CSV file as RawDataFrame chunks of at most ``chunksize`` rows.
+
+        Only one chunk is held in memory at a time. Cells are kept as
+        stripped strings, since column types cannot be inferred from a
+        single chunk. Each chunk carries the file's fieldnames and labels;
+        ``metadata["row_offset"]`` is the number of data rows before it, and
+        row structure issues use row numbers relative to the whole file.
+
+        Args:
+            path: Path to CSV file
+            chunksize: Maximum number of data rows per chunk
+            format_type: Format type (AUTO, STANDARD, MSDIAL)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        path = Path(path)
+        logger.info(f"Reading CSV file in chunks of {chunksize} rows: {path}")
+
+        if not path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+
+        sample = None
+        if format_type == CSVFormat.AUTO or self.delimiter is None:
+            sample = self._read_sniff_buffer(path)
+        if format_type == CSVFormat.AUTO:
+            format_type = self.detect_format(path, sample)
+        if format_type == CSVFormat.MSDIAL:
+            delimiter = "\t"
+        else:
+            format_type = CSVFormat.STANDARD
+            delimiter = self.delimiter or self._detect_delimiter(path, sample)
+
+        # The whole file is decoded up front, so the encoding is settled
+        # before any chunk is yielded. The chunks are then read from the same
+        # open file.
+        encoding = self.encoding
+        file = path.open("r", encoding=encoding, newline="")
+        try:
+            try:
+                self._decode_to_end(file)
+            except UnicodeDecodeError:
+                logger.info(f"Failed to decode with {encoding}, trying latin-1")
+                file.close()
+                encoding = "latin-1"
+                file = path.open("r", encoding=encoding, newline="")
+            file.seek(0)
+
+            reader = csv.reader(file, delimiter=delimiter)
+            fieldnames, labels, rows_iter = self._read_header(reader, self.has_labels)
+            offset = 0
+            while True:
+                batch = list(islice(rows_iter, chunksize))
+                if not batch:
+                    return
+                columns, row_structure_issues = self._sanitize_rows(
+                    fieldnames, batch, start=offset + 1
+                )
+                yield RawDataFrame.from_columns(
+                    fieldnames,
+                    columns,
+                    format_type=format_type,
+                    labels=labels,
+                    metadata={
+                        "source_file": str(path),
+                        "delimiter": delimiter,
+                        "encoding": encoding,
+                        "row_offset": offset,
+                        "row_structure_issues": row_structure_issues,
+                    },
+                )
+                offset += len(batch)
+        finally:
+            file.close()
+
+    @staticmethod
+    def _decode_to_end(file: TextIO, block_size: int = 1 << 20) -> None:
+        """Read ``file`` to the end, raising UnicodeDecodeError on bad bytes."""
+        while file.read(block_size):
+            pass
+
+    @staticmethod
+    def _read_header(
+        reader: Iterator[List[str]], has_labels: bool
+    ) -> Tuple[List[str], List[Optional[str]], Iterator[List[str]]]:
+        """Read the header and optional label row from a csv.reader.
+
+        Returns (fieldnames, labels, rows) where ``rows`` yields the remaining
+        data rows, skipping blank lines. Labels are padded with None to the
+        header width.
+        """
+        fieldnames = next(reader, [])
+        rows_iter = (row for row in reader if row)
+        labels: List[Optional[str]] = []
+        if has_labels:
+            first = next(rows_iter, None)
+            if first is not None:
+                labels = [
+                    first[i] if i < len(first) else None for i in range(len(fieldnames))
+                ]
+        return fieldnames, labels, rows_iter
 
     def read_msdial(self, path: Path) -> RawDataFrame:
         """Read MS-DIAL formatted CSV file.
@@ -209,21 +461,34 @@ class CSVIngestion(BaseModel):
 
         return result
 
-    def detect_format(self, path: Path) -> CSVFormat:
+    def _read_sniff_buffer(self, path: Path, size: int = 8192) -> str:
+        """Return the first ``size`` characters of the file for detection.
+
+        Falls back to latin-1 when the prefix is not valid in ``encoding``,
+        as the readers do.
+        """
+        try:
+            with path.open("r", encoding=self.encoding) as fh:
+                return fh.read(size)
+        except UnicodeDecodeError:
+            with path.open("r", encoding="latin-1") as fh:
+                return fh.read(size)
+
+    def detect_format(self, path: Path, sample: Optional[str] = None) -> CSVFormat:
         """Detect CSV format by inspecting file contents.
 
         Args:
             path: Path to CSV file
+            sample: Start of the file, if already read (see _read_sniff_buffer)
 
         Returns:
             Detected CSVFormat
         """
-        # Read first few lines to detect format
-        with path.open("r", encoding=self.encoding) as fh:
-            lines = [fh.readline() for _ in range(5)]
+        if sample is None:
+            sample = self._read_sniff_buffer(path)
 
         # Check for MS-DIAL indicators
-        header = lines[0].lower() if lines else ""
+        header = sample.split("\n", 1)[0].lower()
 
         msdial_indicators = ["alignment id", "average rt", "metabolite name", "ms-dial"]
 
@@ -234,90 +499,158 @@ class CSVIngestion(BaseModel):
         logger.debug("Defaulting to STANDARD format")
         return CSVFormat.STANDARD
 
-    def _detect_delimiter(self, path: Path) -> str:
+    def _detect_delimiter(self, path: Path, sample: Optional[str] = None) -> str:
         """Detect CSV delimiter by analyzing first few lines.
 
+        Uses csv.Sniffer, which ignores delimiters inside quoted fields and
+        prefers one that splits lines consistently. When the sniffer cannot
+        decide (e.g. rows of uneven width), the most frequent supported
+        delimiter in the sample is used.
+
         Args:
             path: Path to CSV file
+            sample: Start of the file, if already read (see _read_sniff_buffer)
 
         Returns:
             Most likely delimiter character
         """
-        with path.open("r", encoding=self.encoding) as fh:
-            sample = fh.read(8192)  # Read first 8KB
+        if sample is None:
+            sample = self._read_sniff_buffer(path)
 
-        # Count occurrences of each delimiter
-        delimiter_counts = {
-            delim: sample.count(delim) for delim in self.SUPPORTED_DELIMITERS
-        }
-
-        # Return delimiter with highest count
-        detected = max(delimiter_counts, key=delimiter_counts.get)
+        # Only sniff complete lines; a truncated last line skews consistency
+        complete = sample[: sample.rfind("\n") + 1] or sample
+        try:
+            detected = csv.Sniffer().sniff(
+                complete, delimiters="".join(self.SUPPORTED_DELIMITERS)
+            ).delimiter
+        except csv.Error:
+            # Count occurrences of each delimiter
+            delimiter_counts = {
+                delim: sample.count(delim) for delim in self.SUPPORTED_DELIMITERS
+            }
+            # Return delimiter with highest count
+            detected = max(delimiter_counts, key=delimiter_counts.get)
         logger.debug(f"Detected delimiter: {repr(detected)}")
 
         return detected
 
     def _sanitize_rows(
-        self, fieldnames: List[str], rows: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, str]], Dict[int, Dict[str, Any]]]:
-        """Normalize row values and record structural anomalies."""
-        sanitized_rows: List[Dict[str, str]] = []
+        self, fieldnames: List[str], rows: Iterable[List[str]], start: int = 1
+    ) -> Tuple[List[List[str]], Dict[int, Dict[str, Any]]]:
+        """Collect positional rows into one list of stripped values per
+        fieldname, recording structural anomalies (short rows, extra fields).
+
+        Short rows are padded with "" so every column has one value per row.
+        Anomalies are keyed by row number, counting from ``start``.
+        """
+        columns: List[List[str]] = [[] for _ in fieldnames]
+        appends = [column.append for column in columns]
         row_structure: Dict[int, Dict[str, Any]] = {}
-        for idx, row in enumerate(rows, start=1):
-            clean_row: Dict[str, str] = {}
-            missing_columns = []
-            for column in fieldnames:
-                value = row.get(column)
-                if value is None:
-                    missing_columns.append(column)
-                    clean_row[column] = ""
-                elif isinstance(value, str):
-                    clean_row[column] = value.strip()
-                else:
-                    clean_row[column] = str(value)
-
-            extra_values: List[str] = []
-            if None in row:
-                extras = row.get(None) or []
-                if not isinstance(extras, list):
-                    extras = [extras]
-                extra_values = [str(v).strip() for v in extras if v is not None]
-
-            if missing_columns or extra_values:
-                row_structure[idx] = {}
-                if missing_columns:
-                    row_structure[idx]["missing_columns"] = missing_columns
-                if extra_values:
-                    row_structure[idx]["extra_fields"] = extra_values
-
-            sanitized_rows.append(clean_row)
-
-        return sanitized_rows, row_structure
+        n_fields = len(fieldnames)
+        for idx, row in enumerate(rows, start=start):
+            n_values = len(row)
+            if n_values == n_fields:
+                for append, value in zip(appends, row):
+                    append(value.strip())
+                continue
+
+            for i, append in enumerate(appends):
+                append(row[i].strip() if i < n_values else "")
+            missing_columns = fieldnames[n_values:]
+            extra_values = [v.strip() for v in row[n_fields:]]
+
+            row_structure[idx] = {}
+            if missing_columns:
+                row_structure[idx]["missing_columns"] = missing_columns
+            if extra_values:
+                row_structure[idx]["extra_fields"] = extra_values
+
+        return columns, row_structure
 
     def read_batch(
-        self, paths: List[Union[str, Path]], format_type: CSVFormat = CSVFormat.AUTO
+        self,
+        paths: List[Union[str, Path]],
+        format_type: CSVFormat = CSVFormat.AUTO,
+        max_workers: Optional[int] = None,
     ) -> List[RawDataFrame]:
         """Read multiple CSV files.
 
+        Files are parsed in parallel worker processes (parsing is CPU-bound
+        and mostly holds the GIL). A single file, or a single worker, reads
+        in-process, as does the whole batch if the worker pool breaks. Log
+        records from the workers are replayed in this process.
+
+        On platforms that start workers with "spawn" (macOS, Windows), a
+        script calling this must guard its entry point with
+        ``if __name__ == "__main__":``; without it the pool breaks and the
+        files are read serially instead.
+
         Args:
             paths: List of file paths
             format_type: Format type for all files
+            max_workers: Maximum number of worker processes
+                (default: one per CPU, capped at the number of files)
 
         Returns:
-            List of RawDataFrame objects
+            List of RawDataFrame objects, in the order of ``paths``
         """
-        results = []
-        for path in paths:
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        results = None
+        if workers > 1:
             try:
-                df = self.read_csv(path, format_type)
-                results.append(df)
-            except Exception as e:
-                logger.error(f"Failed to read {path}: {e}")
-                # Continue with other files
+                results = self._read_parallel(paths, format_type, workers)
+            except BrokenProcessPool as e:
+                logger.warning(f"Worker processes failed ({e}); reading files in-process")
+        if results is None:
+            results = []
+            for path in paths:
+                try:
+                    df = self.read_csv(path, format_type)
+                    results.append(df)
+                except Exception as e:
+                    logger.error(f"Failed to read {path}: {e}")
+                    # Continue with other files
 
         logger.info(f"Successfully read {len(results)} of {len(paths)} files")
         return results
 
+    def _read_parallel(
+        self, paths: List[Union[str, Path]], format_type: CSVFormat, workers: int
+    ) -> List[RawDataFrame]:
+        """Read ``paths`` in a pool of ``workers`` processes, keeping order.
+
+        Raises BrokenProcessPool if the pool dies, so the caller can fall
+        back to reading in-process.
+        """
+        results = []
+        context = multiprocessing.get_context()
+        log_queue = context.Queue()
+        listener = QueueListener(log_queue, _ForwardHandler())
+        listener.start()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logger.getEffectiveLevel()),
+            ) as executor:
+                futures = [
+                    (path, executor.submit(self.read_csv, path, format_type))
+                    for path in paths
+                ]
+                for path, future in futures:
+                    try:
+                        results.append(future.result())
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Failed to read {path}: {e}")
+                        # Continue with other files
+        finally:
+            listener.stop()
+            log_queue.close()
+        return results
+
     def get_column_info(self, raw_df: RawDataFrame) -> Dict[str, Any]:
         """Get information about columns in the data frame.
 
@@ -334,17 +667,13 @@ class CSVIngestion(BaseModel):
             "column_types": {},
         }
 
-        # Check for empty columns
         for col in raw_df.fieldnames:
-            values = [row.get(col, "").strip() for row in raw_df.rows]
-            non_empty = [v for v in values if v]
-
-            if not non_empty:
+            # Only the first 100 non-empty cells are sampled
+            sample = list(islice(filter(None, raw_df.column(col)), 100))
+            if not sample:
                 info["empty_columns"].append(col)
             else:
-                # Try to determine column type
-                info["column_types"][col] = self._guess_column_type(non_empty)
-
+                info["column_types"][col] = self._guess_column_type(sample)
         return info
 
     def _guess_column_type(self, values: List[str]) -> str:
@@ -362,16 +691,18 @@ class CSVIngestion(BaseModel):
         # Sample up to 100 values
         sample = values[:100]
 
-        numeric_count = 0
+        # If >80% numeric, consider it numeric. Stop parsing as soon as the
+        # outcome is settled either way; each failed float() raises.
+        max_failures = len(sample) - int(len(sample) * 0.8) - 1
+        failures = 0
         for val in sample:
             try:
                 float(val)
-                numeric_count += 1
             except ValueError:
-                pass
-
-        # If >80% numeric, consider it numeric
-        if numeric_count / len(sample) > 0.8:
+                failures += 1
+                if failures > max_failures:
+                    break
+        else:
             return "numeric"
 
         # Check if looks like identifiers (short, alphanumeric)
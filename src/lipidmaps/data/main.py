@@ -2,18 +2,15 @@ from __future__ import annotations
 
 import argparse
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from .data_manager import DataManager
 from .ingestion.csv_reader import CSVFormat
+from .models.refmet import RefMet
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("lipidmaps_py.log"), logging.StreamHandler()],
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +53,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fill missing LM IDs using headgroup mapping after LMSD fill",
     )
+    parser.add_argument(
+        "--refmet-cache",
+        dest="refmet_cache",
+        metavar="SQLITE_PATH",
+        help="Cache RefMet results in this SQLite file so re-runs skip known names",
+    )
     parser.add_argument(
         "--groups",
         nargs="*",
@@ -83,7 +86,35 @@ def parse_group_mapping(raw_groups: list[str] | None) -> dict[str, list[str]] |
     return mapping or None
 
 
+def start_logging() -> QueueListener:
+    """Route log records through a queue to a background listener thread.
+
+    Records are formatted by the QueueHandler on the calling thread and
+    written to file/console by the listener, so logging never blocks on I/O.
+    The caller stops the returned listener to flush it.
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, logging.FileHandler("lipidmaps_py.log"), logging.StreamHandler()
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+    listener.start()
+    return listener
+
+
 def main() -> None:
+    listener = start_logging()
+    try:
+        run()
+    finally:
+        listener.stop()
+
+
+def run() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
@@ -93,6 +124,9 @@ def main() -> None:
 
     logger.info(f"Processing CSV: {csv_path}")
 
+    if args.refmet_cache:
+        RefMet.CACHE_PATH = str(Path(args.refmet_cache).expanduser())
+
     group_mapping = parse_group_mapping(args.groups)
     manager = DataManager(
         validate_data=args.validate,
@@ -113,6 +147,10 @@ def main() -> None:
     logger.info(f"Dataset ready: {len(dataset.samples)} samples, {len(dataset.lipids)} lipids")
     logger.info(f"Sample column info: {dataset.samples[:4]}")
 
+    # Start the reaction lookup for LM IDs RefMet already found so it runs
+    # while the optional LMSD/headgroup fills below are in flight
+    prefetched_reactions = manager.prefetch_reactions(dataset)
+
     # Optionally fill missing LM IDs using LMSD and report what changed
     if getattr(args, "fill_lmsd", False):
         # Use DataManager helper to run LMSD fill and report updates
@@ -135,7 +173,7 @@ def main() -> None:
     from .models.reaction import Reaction
 
     # Fetch reactions for all LM IDs in the dataset 
-    reactions = manager.fetch_reactions_for_lm_ids(dataset)
+    reactions = manager.fetch_reactions_for_lm_ids(dataset, prefetched=prefetched_reactions)
     manager.annotate_lipids_with_reactions(reactions)
     print_annotated_lipids_with_reactions(manager, n=100)
 
@@ -1,7 +1,9 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Union, Any
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from ..utils.http import build_session
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +20,34 @@ class LMSDResult(BaseModel):
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump()
 
+
+# Validates and dumps a whole JSON response in one call each, instead of
+# building and dumping an LMSDResult per item
+_RESULTS_ADAPTER = TypeAdapter(List[LMSDResult])
+
+
 class LMSD:
     LMSDNameUrl = "https://lipidmaps.org/api/reactions/names"
+    # Names per LMSD request and number of requests in flight at once
+    BATCH_SIZE = 500
+    MAX_WORKERS = 4
+    _SESSION: Optional[requests.Session] = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared LMSD session, creating it on first use."""
+        if cls._SESSION is None:
+            cls._SESSION = build_session()
+        return cls._SESSION
 
     @staticmethod
     def get_lm_ids_by_name(lipid_names: List[str]) -> Union[List[Dict[str, Any]], Dict[str, Any], None]:
         """Return lm_id's and associated names using LMSD API.
 
+        Names are split into batches of ``BATCH_SIZE`` which are posted
+        concurrently (up to ``MAX_WORKERS`` at a time) and concatenated in
+        input order.
+
         Args:
             lipid_names: List of lipid name strings to validate
 
@@ -32,10 +55,33 @@ class LMSD:
             List of dictionaries (serialized LMSDResult) one per input name,
             or an error dictionary with an `error` key on failure.
         """
+        batches = [
+            lipid_names[i : i + LMSD.BATCH_SIZE]
+            for i in range(0, len(lipid_names), LMSD.BATCH_SIZE)
+        ]
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return LMSD._query_batch(batches[0])
+
+        results: List[Dict[str, Any]] = []
+        workers = min(LMSD.MAX_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Batches are appended in input order as each one completes
+            for res in executor.map(LMSD._query_batch, batches):
+                # Any failed batch fails the whole lookup, as a single request would
+                if isinstance(res, dict):
+                    return res
+                results.extend(res)
+        return results
+
+    @staticmethod
+    def _query_batch(lipid_names: List[str]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """Look up one batch of names; same return shape as get_lm_ids_by_name."""
         data = {"names": lipid_names}
         try:
             logger.info("Sending request to LMSD API")
-            response = requests.post(
+            response = LMSD._get_session().post(
                 LMSD.LMSDNameUrl, json=data, verify=False, timeout=20
             )
             response.raise_for_status()
@@ -61,22 +107,9 @@ class LMSD:
                 json_list = None
 
             if json_list is not None:
-                results: List[Dict[str, Any]] = []
-
-                for item in json_list:  
-
-                    res = LMSDResult(
-                        input_name=item.get('input_name'),
-                        matched_field=item.get('matched_field'),
-                        name=item.get('name'),
-                        sys_name=item.get('sys_name'),
-                        abbrev=item.get('abbrev'),
-                        abbrev_chains=item.get('abbrev_chains'),
-                        lm_id=item.get('lm_id'),
-                    )
-                    results.append(res.to_dict())
-
-                return results
+                return _RESULTS_ADAPTER.dump_python(
+                    _RESULTS_ADAPTER.validate_python(json_list)
+                )
 
         # Fallback: treat the response as TSV/text (legacy behaviour)
         lines = [ln for ln in response.text.splitlines() if ln.strip()]
@@ -102,43 +135,38 @@ class LMSD:
 
             return None
 
-        input_idx = find('input_name')
-        matched_idx = find('matched_field')
-        name_idx = find('name')
-        sys_name_idx = find('sys_name')
-        abbrev_idx = find('abbrev')
-        abbrev_chains_idx = find('abbrev_chains')
-        lm_id_idx = find('lm_id')
+        # (field, column index) for the fields present in this response
+        columns = []
+        for field in (
+            'input_name', 'matched_field', 'name', 'sys_name',
+            'abbrev', 'abbrev_chains', 'lm_id',
+        ):
+            i = find(field)
+            if i is not None:
+                columns.append((field, i))
+        width = len(header)
 
         results: List[Dict[str, Any]] = []
 
         for ln in lines[1:]:
             cols = ln.split('\t')
+            # Pad short rows once so the lookups below need no bounds checks
+            if len(cols) < width:
+                cols += [''] * (width - len(cols))
 
-            def get(i: Optional[int]) -> Optional[str]:
-                if i is None:
-                    return None
-                if i < 0 or i >= len(cols):
-                    return None
+            values: Dict[str, Any] = {}
+            for field, i in columns:
                 val = cols[i].strip()
-                return val if val != '' else None
-
-            abbrev_chains_val = get(abbrev_chains_idx)
-            try:
-                abbrev_chains = float(abbrev_chains_val) if abbrev_chains_val is not None else None
-            except (ValueError, TypeError):
-                abbrev_chains = None
-
-            res = LMSDResult(
-                input_name=get(input_idx),
-                matched_field=get(matched_idx),
-                name=get(name_idx),
-                sys_name=get(sys_name_idx),
-                abbrev=get(abbrev_idx),
-                abbrev_chains=abbrev_chains,
-                lm_id=get(lm_id_idx),
-            )
+                if val != '':
+                    values[field] = val
+
+            abbrev_chains_val = values.get('abbrev_chains')
+            if abbrev_chains_val is not None:
+                try:
+                    values['abbrev_chains'] = float(abbrev_chains_val)
+                except ValueError:
+                    values['abbrev_chains'] = None
 
-            results.append(res.to_dict())
+            results.append(LMSDResult(**values).to_dict())
 
         return results
\ No newline at end of file
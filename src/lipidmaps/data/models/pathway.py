@@ -20,4 +20,4 @@ class Pathway(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
-        logger.info(f"Created Pathway: {self.name}")
+        logger.debug("Created Pathway: %s", self.name)
@@ -1,35 +1,60 @@
-from typing import List, Optional, Union, Any, Dict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List, Optional, Union, Any, Dict
 import logging
 
-from pydantic import BaseModel, Field, field_validator
-
 
 logger = logging.getLogger(__name__)
 
 """ IN TEMPLATE PHASE"""
 
 
-class Reaction(BaseModel):
+def _identity(item: Any) -> Any:
+    return item
+
+
+@lru_cache(maxsize=None)
+def _serializer_for(cls: type) -> Callable[[Any], Any]:
+    """Return the function that turns instances of ``cls`` into plain data.
+
+    Resolved once per class instead of probing attributes on every item.
+    Pydantic v2 models use model_dump rather than the deprecated .dict() shim.
+    """
+    for attr in ("model_dump", "to_dict", "dict"):
+        method = getattr(cls, attr, None)
+        if callable(method):
+            return method
+    return _identity
+
+
+@dataclass
+class Reaction:
     """
     - reaction_id: identifier for the reaction
+
+    Plain dataclass rather than a Pydantic model: reactions are built in bulk
+    from already-parsed API payloads, so per-field validation is skipped and
+    only the list normalisation is applied in __post_init__.
     """
 
     reaction_id: Union[str, int]
     reaction_name: str
-    reactants: List[Union[Dict[str, Any], Any]] = Field(default_factory=list)
-    products: List[Union[Dict[str, Any], Any]] = Field(default_factory=list)
-    genes: List[Union[Dict[str, Any], Any]] = Field(default_factory=list)
-    proteins: List[Union[Dict[str, Any], Any]] = Field(default_factory=list)
-    curations: List[Union[Dict[str, Any], Any]] = Field(default_factory=list)
     type: str  # "species-level" or "class-level"
     pathway_id: Optional[str]
     enzyme_id: Optional[str]
+    reactants: List[Union[Dict[str, Any], Any]] = field(default_factory=list)
+    products: List[Union[Dict[str, Any], Any]] = field(default_factory=list)
+    genes: List[Union[Dict[str, Any], Any]] = field(default_factory=list)
+    proteins: List[Union[Dict[str, Any], Any]] = field(default_factory=list)
+    curations: List[Union[Dict[str, Any], Any]] = field(default_factory=list)
 
-    # Pydantic v2 config
-    model_config = {"arbitrary_types_allowed": True}
+    def __post_init__(self) -> None:
+        self.reactants = self._ensure_list(self.reactants)
+        self.products = self._ensure_list(self.products)
+        logger.debug("Created Reaction: %s: %s", self.reaction_id, self.reaction_name)
 
-    @field_validator("reactants", "products", mode="before")
-    def _ensure_list(cls, v):
+    @staticmethod
+    def _ensure_list(v):
         # Accept None -> empty list
         if v is None:
             return []
@@ -38,26 +63,14 @@ class Reaction(BaseModel):
             return [v]
         return v
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        logger.info(f"Created Reaction: {self.reaction_id}: {self.reaction_name}")
-
     def to_dict(self) -> Dict[str, Any]:
         """
-        Serialize reaction to a plain dict. Entries that expose .dict()/.to_dict()
-        are converted automatically.
+        Serialize reaction to a plain dict. Entries that expose
+        .model_dump()/.to_dict()/.dict() are converted automatically.
         """
-
-        def _serialize_item(item):
-            if hasattr(item, "dict"):
-                return item.dict()
-            if hasattr(item, "to_dict"):
-                return item.to_dict()
-            return item
-
         return {
             "reaction_id": self.reaction_id,
             "reaction_name": self.reaction_name,
-            "reactants": [_serialize_item(s) for s in self.reactants],
-            "products": [_serialize_item(p) for p in self.products],
+            "reactants": [_serializer_for(type(s))(s) for s in self.reactants],
+            "products": [_serializer_for(type(p))(p) for p in self.products],
         }
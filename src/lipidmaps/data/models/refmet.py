@@ -1,8 +1,14 @@
 import logging
-from typing import List, Dict, Optional, Union, Any
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Optional, Union, Any
 import requests
 from pydantic import BaseModel
 
+from ..utils.cache import SQLiteCache
+from ..utils.http import build_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,157 +29,245 @@ class RefMetResult(BaseModel):
         return self.model_dump()
 
 
+# RefMetResult field -> RefMet TSV column header
+_REFMET_COLUMNS = (
+    ("input_name", "Input name"),
+    ("standardized_name", "Standardized name"),
+    ("lm_id", "LM_ID"),
+    ("formula", "Formula"),
+    ("exact_mass", "Exact mass"),
+    ("super_class", "Super class"),
+    ("main_class", "Main class"),
+    ("sub_class", "Sub class"),
+    ("chebi_id", "ChEBI_ID"),
+    ("kegg_id", "KEGG_ID"),
+    ("refmet_id", "RefMet_ID"),
+)
+_INTERNED_FIELDS = frozenset({"super_class", "main_class", "sub_class"})
+
+
 class RefMet:
     MWBaseURL = "https://www.metabolomicsworkbench.org/databases/refmet/name_to_refmet_new_minID.php"
+    # Names per RefMet request and number of requests in flight at once
+    BATCH_SIZE = 500
+    MAX_WORKERS = 4
+    # Optional SQLite file caching results by input name across runs
+    CACHE_PATH: Optional[str] = None
+    # Matched results by input name for the life of the process
+    _MEMORY_CACHE: Dict[str, RefMetResult] = {}
+    _SESSION: Optional[requests.Session] = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared RefMet session, creating it on first use."""
+        if cls._SESSION is None:
+            cls._SESSION = build_session()
+        return cls._SESSION
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget results cached in memory by earlier calls."""
+        cls._MEMORY_CACHE.clear()
+
+    @classmethod
+    def _get_cache(cls) -> Optional[SQLiteCache]:
+        """Return the persistent result cache, or None when caching is off or unusable."""
+        if not cls.CACHE_PATH:
+            return None
+        try:
+            return SQLiteCache(cls.CACHE_PATH, table="refmet")
+        except sqlite3.Error as e:
+            logger.warning("RefMet cache %s unavailable: %s", cls.CACHE_PATH, e)
+            return None
 
     @staticmethod
     def validate_metabolite_names(metabolite_names: List[str]) -> Union[List[RefMetResult], Dict[str, Any]]:
         """Validate metabolite names using RefMet API and return RefMetResult objects.
 
+        Duplicate names are queried once, and names matched by an earlier
+        call in this process are not queried again. When ``CACHE_PATH`` is
+        set, names with a cached result there are not queried either and new
+        matches are written back. The remaining names are split into batches of
+        ``BATCH_SIZE`` which are posted concurrently (up to ``MAX_WORKERS``
+        at a time) and merged back in input order.
+
         Args:
             metabolite_names: List of metabolite name strings to validate
 
         Returns:
             List of RefMetResult objects, one per input name
         """
-        data = {"metabolite_name": "\n".join(metabolite_names)}
-        try:
-            logger.info("Sending request to RefMet API")
-            response = requests.post(
-                RefMet.MWBaseURL, data=data, verify=False, timeout=20
+        # Each distinct name is sent once; results fan back out per input below
+        unique_names = list(dict.fromkeys(metabolite_names))
+        if not unique_names:
+            return []
+
+        # Copies, so callers mutating a result do not alter the cache
+        lookup: Dict[str, RefMetResult] = {
+            name: RefMet._MEMORY_CACHE[name].model_copy()
+            for name in unique_names
+            if name in RefMet._MEMORY_CACHE
+        }
+        cache = RefMet._get_cache()
+        if cache is not None and len(lookup) < len(unique_names):
+            try:
+                cached = cache.get_many(
+                    [name for name in unique_names if name not in lookup]
+                )
+            except sqlite3.Error as e:
+                logger.warning("RefMet cache read failed: %s", e)
+                cache, cached = None, {}
+            for name, payload in cached.items():
+                lookup[name] = RefMetResult(**payload)
+                RefMet._MEMORY_CACHE[name] = lookup[name].model_copy()
+            if cached:
+                logger.info("RefMet cache hit for %d of %d names", len(cached), len(unique_names))
+        has_rows = bool(lookup)
+
+        to_query = [name for name in unique_names if name not in lookup]
+        batches = [
+            to_query[i : i + RefMet.BATCH_SIZE]
+            for i in range(0, len(to_query), RefMet.BATCH_SIZE)
+        ]
+        fetched: Dict[str, RefMetResult] = {}
+        if batches:
+            try:
+                logger.info(
+                    f"Sending {len(batches)} request(s) to RefMet API for {len(to_query)} unique names"
+                )
+                with ThreadPoolExecutor(
+                    max_workers=min(RefMet.MAX_WORKERS, len(batches))
+                ) as executor:
+                    # Merge each batch as it arrives so parsed batches are not all
+                    # held until the last request finishes
+                    for parsed in executor.map(RefMet._fetch_batch, batches):
+                        if parsed is not None:
+                            has_rows = True
+                            fetched.update(parsed)
+            except requests.RequestException as e:
+                logger.error(f"RefMet API call failed: {e}")
+                # Return empty list on failure
+                return {"error": str(e)}
+            lookup.update(fetched)
+            RefMet._MEMORY_CACHE.update(
+                (name, r.model_copy()) for name, r in fetched.items()
             )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error(f"RefMet API call failed: {e}")
-            # Return empty list on failure
-            return {"error": str(e)}
 
-        lines = [ln for ln in response.text.splitlines() if ln.strip()]
-        if not lines or len(lines) < 2:
+        if cache is not None and fetched:
+            try:
+                cache.set_many({name: r.model_dump() for name, r in fetched.items()})
+            except sqlite3.Error as e:
+                logger.warning("RefMet cache write failed: %s", e)
+
+        if not has_rows:
             logger.warning("RefMet returned empty response")
             return []
 
-        header = lines[0].split("\t")
+        refmet_results: List[RefMetResult] = []
+        unmatched: Dict[str, RefMetResult] = {}
+        matched = 0
+        log_each = logger.isEnabledFor(logging.DEBUG)
 
-        def idx(name: str) -> Optional[int]:
-            return header.index(name) if name in header else None
+        # Ensure we have a result for each input name (fallback to identity if no match)
+        for name in metabolite_names:
+            result = lookup.get(name)
+            if result is not None:
+                matched += 1
+            else:
+                # One fallback per distinct unmatched name
+                result = unmatched.get(name)
+                if result is None:
+                    result = unmatched[name] = RefMetResult(input_name=name)
+            refmet_results.append(result)
+            if log_each:
+                logger.debug(
+                    "Validated '%s' -> standardized: '%s', lm_id: %s",
+                    name,
+                    result.standardized_name,
+                    result.lm_id,
+                )
 
-        input_idx = idx("Input name")
-        standardized_idx = idx("Standardized name")
-        lm_id_idx = idx("LM_ID")
-        formula_idx = idx("Formula")
-        exact_mass_idx = idx("Exact mass")
-        super_class_idx = idx("Super class")
-        main_class_idx = idx("Main class")
-        sub_class_idx = idx("Sub class")
-        chebi_id_idx = idx("ChEBI_ID")
-        kegg_id_idx = idx("KEGG_ID")
-        refmet_id_idx = idx("RefMet_ID")
+        logger.info(
+            "Annotated %d metabolites via RefMet, %d matched",
+            len(refmet_results),
+            matched,
+        )
+        return refmet_results
 
-        refmet_results: List[RefMetResult] = []
-        lookup: Dict[str, RefMetResult] = {}
+    @staticmethod
+    def _fetch_batch(names: List[str]) -> Optional[Dict[str, RefMetResult]]:
+        """Query RefMet for one batch of names and parse the streamed response."""
+        return RefMet._parse_response(RefMet._post_names(names))
 
-        for line in lines[1:]:
-            fields = line.split("\t")
-            input_name = (
-                fields[input_idx]
-                if input_idx is not None and len(fields) > input_idx
-                else None
-            )
-            standardized = (
-                fields[standardized_idx]
-                if standardized_idx is not None and len(fields) > standardized_idx
-                else None
-            )
-            lm_id = (
-                fields[lm_id_idx]
-                if lm_id_idx is not None and len(fields) > lm_id_idx
-                else None
-            )
-            formula = (
-                fields[formula_idx]
-                if formula_idx is not None and len(fields) > formula_idx
-                else None
-            )
-            exact_mass = (
-                fields[exact_mass_idx]
-                if exact_mass_idx is not None and len(fields) > exact_mass_idx
-                else None
-            )
-            super_class = (
-                fields[super_class_idx]
-                if super_class_idx is not None and len(fields) > super_class_idx
-                else None
-            )
-            main_class = (
-                fields[main_class_idx]
-                if main_class_idx is not None and len(fields) > main_class_idx
-                else None
-            )
-            sub_class = (
-                fields[sub_class_idx]
-                if sub_class_idx is not None and len(fields) > sub_class_idx
-                else None
-            )
-            chebi_id = (
-                fields[chebi_id_idx]
-                if chebi_id_idx is not None and len(fields) > chebi_id_idx
-                else None
-            )
-            kegg_id = (
-                fields[kegg_id_idx]
-                if kegg_id_idx is not None and len(fields) > kegg_id_idx
-                else None
-            )
-            refmet_id = (
-                fields[refmet_id_idx]
-                if refmet_id_idx is not None and len(fields) > refmet_id_idx
-                else None
-            )
+    @staticmethod
+    def _post_names(names: List[str]) -> Iterator[str]:
+        """POST one batch of names to RefMet and yield the TSV response lines.
 
-            # Convert dash values to None
-            input_name = None if input_name == "-" else input_name
-            standardized = None if standardized == "-" else standardized
-            lm_id = None if lm_id == "-" else lm_id
-            sub_class = None if sub_class == "-" else sub_class
-            formula = None if formula == "-" else formula
-            exact_mass = None if exact_mass == "-" else exact_mass
-            super_class = None if super_class == "-" else super_class
-            main_class = None if main_class == "-" else main_class
-            chebi_id = None if chebi_id == "-" else chebi_id
-            kegg_id = None if kegg_id == "-" else kegg_id
-            refmet_id = None if refmet_id == "-" else refmet_id
-
-            result = RefMetResult(
-                input_name=input_name,
-                standardized_name=standardized,
-                lm_id=(lm_id if lm_id else None),
-                sub_class=(sub_class if sub_class else None),
-                formula=(formula if formula else None),
-                exact_mass=(exact_mass if exact_mass else None),
-                super_class=(super_class if super_class else None),
-                main_class=(main_class if main_class else None),
-                chebi_id=(chebi_id if chebi_id else None),
-                kegg_id=(kegg_id if kegg_id else None),
-                refmet_id=(refmet_id if refmet_id else None),
-            )
+        The body is streamed and decoded line by line rather than buffered
+        as a single string.
+        """
+        data = {"metabolite_name": "\n".join(names)}
+        session = RefMet._get_session()
+        response = session.post(
+            RefMet.MWBaseURL, data=data, verify=False, timeout=20, stream=True
+        )
+        try:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            yield from response.iter_lines(chunk_size=64 * 1024, decode_unicode=True)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _parse_response(
+        lines: Union[str, Iterable[str]]
+    ) -> Optional[Dict[str, RefMetResult]]:
+        """Parse a RefMet TSV response into a lookup of input name -> RefMetResult.
+
+        Accepts the response text or an iterable of its lines. Returns None
+        when the response has no data rows.
+        """
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+        lines = (ln for ln in lines if ln.strip())
+        header_line = next(lines, None)
+        if header_line is None:
+            return None
+
+        header = header_line.split("\t")
+        # (field, column index) for the columns present in this response
+        columns = [
+            (field, header.index(column))
+            for field, column in _REFMET_COLUMNS
+            if column in header
+        ]
+
+        width = len(header)
+        lookup: Dict[str, RefMetResult] = {}
+        has_rows = False
+        for line in lines:
+            has_rows = True
+            fields = line.split("\t")
+            # Pad short rows once so the lookups below need no bounds checks
+            if len(fields) < width:
+                fields += [""] * (width - len(fields))
+            values: Dict[str, str] = {}
+            for field, i in columns:
+                value = fields[i]
+                # "-" and empty cells mean no value
+                if value and value != "-":
+                    # Class names repeat across most rows; share one string object each
+                    values[field] = (
+                        sys.intern(value) if field in _INTERNED_FIELDS else value
+                    )
 
-            # logger.info(f"RefMet result: {result.standardized_name}")
+            result = RefMetResult(**values)
+            input_name = values.get("input_name")
             if input_name:
                 lookup[input_name] = result
 
-        # Ensure we have a result for each input name (fallback to identity if no match)
-        for name in metabolite_names:
-            if name in lookup:
-                refmet_results.append(lookup[name])
-            else:
-                refmet_results.append(RefMetResult(input_name=name))
-            logger.info(
-                f"Validated '{name}' -> standardized: '{refmet_results[-1].standardized_name}', lm_id: {refmet_results[-1].lm_id}"
-            )
-
-        logger.info(f"Annotated {len(refmet_results)} metabolites via RefMet")
-        return refmet_results
+        return lookup if has_rows else None
 
     @staticmethod
     def attach_results_to_samples(
@@ -190,11 +284,20 @@ class RefMet:
                 f"Length mismatch: {len(samples)} samples vs {len(results)} results"
             )
 
+        # Duplicate input names share one result object; dump each once and
+        # give every sample its own shallow copy of the (flat) dict
+        dumps: Dict[int, Dict[str, Any]] = {}
+        log_each = logger.isEnabledFor(logging.DEBUG)
         for sample, result in zip(samples, results):
-            sample.refmet_result = result.model_dump()
-            logger.debug(
-                f"Attached RefMet result to sample {getattr(sample, 'sample_name', 'unknown')}"
-            )
+            dumped = dumps.get(id(result))
+            if dumped is None:
+                dumped = dumps[id(result)] = result.model_dump()
+            sample.refmet_result = dict(dumped)
+            if log_each:
+                logger.debug(
+                    "Attached RefMet result to sample %s",
+                    getattr(sample, "sample_name", "unknown"),
+                )
 
     @staticmethod
     def annotate_samples(samples: List[Any]) -> List[RefMetResult]:
@@ -217,33 +320,34 @@ class RefMet:
     @staticmethod
     def get_lm_ids(samples: List[Any]) -> List[str]:
         """Return unique LM_IDs from samples that have a refmet_result with lm_id starting with 'LM'."""
-        lm_ids = []
+        # attach_results_to_samples stores dicts, so that branch comes first
+        lm_ids = set()
         for s in samples:
             r = getattr(s, "refmet_result", None)
-            lm_id = None
-            if isinstance(r, RefMetResult):
-                lm_id = r.lm_id
-            elif isinstance(r, dict):
+            if isinstance(r, dict):
                 lm_id = r.get("lm_id")
+            elif isinstance(r, RefMetResult):
+                lm_id = r.lm_id
+            else:
+                continue
             if lm_id and lm_id.startswith("LM"):
-                lm_ids.append(lm_id)
-        return list(set(lm_ids))
+                lm_ids.add(lm_id)
+        return list(lm_ids)
 
     @staticmethod
     def get_unmatched_results(samples: List[Any]) -> List[str]:
         """Return unique standardized names for samples that were not matched (lm_id is None)."""
-        unmatched = []
+        unmatched = set()
         for s in samples:
             r = getattr(s, "refmet_result", None)
-            standardized = None
-            lm_id = None
-            if isinstance(r, RefMetResult):
-                standardized = r.standardized_name
-                lm_id = r.lm_id
-            elif isinstance(r, dict):
+            if isinstance(r, dict):
                 standardized = r.get("standardized_name")
                 lm_id = r.get("lm_id")
+            elif isinstance(r, RefMetResult):
+                standardized = r.standardized_name
+                lm_id = r.lm_id
+            else:
+                continue
             if standardized and lm_id is None:
-                unmatched.append(standardized)
-        # logger.info("Unmatched samples: %s", unmatched)
-        return list(set(unmatched))
+                unmatched.add(standardized)
+        return list(unmatched)
@@ -5,6 +5,20 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# QuantifiedLipid field -> RefMetResult field copied by apply_refmet
+_REFMET_FIELDS = (
+    ("standardized_name", "standardized_name"),
+    ("lm_id", "lm_id"),
+    ("sub_class", "sub_class"),
+    ("formula", "formula"),
+    ("mass", "exact_mass"),
+    ("super_class", "super_class"),
+    ("main_class", "main_class"),
+    ("chebi_id", "chebi_id"),
+    ("kegg_id", "kegg_id"),
+    ("refmet_id", "refmet_id"),
+)
+
 
 class SampleMetadata(BaseModel):
     sample_id: str
@@ -45,13 +59,42 @@ class QuantifiedLipid(BaseModel):
     reactions: Optional[List[SampleReactionInfo]] = None
     weight: Optional[float] = None  # For species or class-level reaction
 
+    @classmethod
+    def from_parsed(cls, input_name: str, values: Dict[str, float], **fields: Any) -> "QuantifiedLipid":
+        """Build a QuantifiedLipid from already-clean data without validation.
+
+        For bulk ingestion where ``values`` has already been converted to
+        floats; unknown or mistyped fields are not checked.
+        """
+        return cls.model_construct(input_name=input_name, values=values, **fields)
+
+    def apply_refmet(self, result: Any) -> None:
+        """Copy the annotation fields of a RefMetResult onto this lipid.
+
+        The fields are written in one update of the instance dict rather than
+        one attribute assignment each; ``result`` is already validated.
+        """
+        source = result.__dict__
+        patch = {field: source[attr] for field, attr in _REFMET_FIELDS}
+        # record that the standardized name / lm_id came from RefMet when present
+        if patch["standardized_name"]:
+            patch["standardized_by"] = "RefMet"
+        if patch["lm_id"]:
+            patch["lm_id_found_by"] = "RefMet"
+        self.__dict__.update(patch)
+        self.__pydantic_fields_set__.update(patch)
+
     def zscore(self) -> Dict[str, float]:
-        vals = np.array(list(self.values.values()))
-        mean = np.mean(vals)
-        std = np.std(vals)
-        return {
-            k: (v - mean) / std if std != 0 else 0.0 for k, v in self.values.items()
-        }
+        """Return each sample's value standardised against this lipid's values.
+
+        All scores are 0.0 when the values do not vary.
+        """
+        if not self.values:
+            return {}
+        vals = np.fromiter(self.values.values(), dtype=np.float64, count=len(self.values))
+        std = vals.std()
+        scores = np.zeros_like(vals) if std == 0 else (vals - vals.mean()) / std
+        return dict(zip(self.values, scores.tolist()))
 
 
 class LipidDataset(BaseModel):
@@ -59,26 +102,88 @@ class LipidDataset(BaseModel):
     lipids: List[QuantifiedLipid]
     column_info: Optional[Dict[str, Any]] = None  # Metadata about CSV columns
 
+    def sample_columns(self) -> Dict[str, int]:
+        """Map each distinct sample id to its column in ``to_matrix``."""
+        unique_ids = dict.fromkeys(s.sample_id for s in self.samples)
+        return {sid: j for j, sid in enumerate(unique_ids)}
+
+    def to_matrix(self) -> np.ndarray:
+        """Return lipid values as a dense (n_lipids, n_samples) float array.
+
+        Rows follow ``self.lipids`` and columns follow ``self.samples``;
+        values missing for a sample are NaN.
+        """
+        col_index = self.sample_columns()
+        matrix = np.full((len(self.lipids), len(col_index)), np.nan)
+        for i, lipid in enumerate(self.lipids):
+            for sid, value in lipid.values.items():
+                j = col_index.get(sid)
+                if j is not None:
+                    matrix[i, j] = value
+        return matrix
+
+    def presence_matrix(self) -> np.ndarray:
+        """Return a boolean array shaped like ``to_matrix``, True where the
+        lipid has a value for the sample. Unlike ``~np.isnan(to_matrix())``,
+        a value that is itself NaN counts as present.
+        """
+        col_index = self.sample_columns()
+        present = np.zeros((len(self.lipids), len(col_index)), dtype=bool)
+        for i, lipid in enumerate(self.lipids):
+            for sid in lipid.values:
+                j = col_index.get(sid)
+                if j is not None:
+                    present[i, j] = True
+        return present
+
+    def zscore_matrix(self) -> np.ndarray:
+        """Return ``to_matrix`` with each row standardised in one vectorised pass.
+
+        Each lipid is scored against its values for the dataset's samples
+        with a plain mean and std, as ``QuantifiedLipid.zscore`` does, so a
+        NaN value makes the whole row NaN and rows whose values do not vary
+        score 0.0. Cells without a value stay NaN. Unlike ``zscore``, values
+        under ids that are not dataset samples have no column and are left
+        out of the mean and std.
+        """
+        matrix = self.to_matrix()
+        present = self.presence_matrix()
+        counts = present.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Rows with no values at all are left as NaN
+            mean = np.where(present, matrix, 0.0).sum(axis=1, keepdims=True) / counts
+            deviations = np.where(present, matrix - mean, 0.0)
+            std = np.sqrt((deviations ** 2).sum(axis=1, keepdims=True) / counts)
+            std[std == 0] = np.inf  # (x - mean) / inf == 0.0 for constant rows
+            return np.where(present, (matrix - mean) / std, np.nan)
+
     def get_grouped_data(self) -> Dict[str, List[QuantifiedLipid]]:
+        """Split each lipid's values by sample group.
+
+        Returns, per group, one unvalidated QuantifiedLipid per lipid holding
+        only that group's sample values.
+        """
         grouped = {}
         for sample in self.samples:
             grouped.setdefault(sample.group, []).append(sample.sample_id)
+        all_values = [lipid.values for lipid in self.lipids]
+        names = [lipid.input_name for lipid in self.lipids]
+        # Copying one constructed lipid is cheaper than a model_construct per
+        # output, which re-applies every field default
+        template = QuantifiedLipid.from_parsed(input_name="", values={})
         result = {}
         for group, sample_ids in grouped.items():
             result[group] = [
-                QuantifiedLipid(
-                    input_name=lipid.input_name,
-                    values={
-                        sid: lipid.values[sid]
-                        for sid in sample_ids
-                        if sid in lipid.values
-                    },
+                template.model_copy(
+                    update={
+                        "input_name": name,
+                        "values": {sid: values[sid] for sid in sample_ids if sid in values},
+                    }
                 )
-                for lipid in self.lipids
+                for name, values in zip(names, all_values)
             ]
         return result
 
-
 if __name__ == "__main__":
 
     lipid = QuantifiedLipid(
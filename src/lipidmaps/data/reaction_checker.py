@@ -1,11 +1,177 @@
 import logging
 import requests
-from typing import List, Any, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Any, Optional, Dict, Tuple
 
 from pydantic import BaseModel, Field
 
+from .utils.http import build_session, iter_json_array
+
 logger = logging.getLogger(__name__)
 
+# LM IDs per reaction API request and number of requests in flight at once
+REACTION_BATCH_SIZE = 500
+REACTION_MAX_WORKERS = 8
+# Distinct (URL, LM IDs, search options) reaction responses kept in memory
+REACTION_CACHE_SIZE = 128
+
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the module-wide reaction API session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        # Compressed JSON; iter_content inflates it chunk by chunk as it streams
+        _SESSION = build_session(
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+        )
+    return _SESSION
+
+
+def _merge_batches(batches: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Concatenate per-batch reaction lists, dropping reactions already seen.
+
+    A reaction touching IDs from several batches is returned by each of them.
+    """
+    merged: List[Dict[str, Any]] = []
+    seen_ids = set()
+    for batch in batches:
+        for raw_reaction in batch:
+            reaction_id = (
+                raw_reaction.get("reaction_id") if isinstance(raw_reaction, dict) else None
+            )
+            if reaction_id is not None:
+                if reaction_id in seen_ids:
+                    continue
+                seen_ids.add(reaction_id)
+            merged.append(raw_reaction)
+    return merged
+
+
+def _lm_main_components(
+    components: Optional[List[Dict[str, Any]]],
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Keep the lm_main entries of a raw component list and join their names.
+
+    Single pass over the raw dicts; the kept dicts are validated later as part
+    of their ReactionData, and non-lm_main components are never validated.
+    """
+    kept: List[Dict[str, Any]] = []
+    names: List[str] = []
+    for comp in components or ():
+        get = comp.get
+        if get("compound_type") != "lm_main":
+            continue
+        kept.append(comp)
+        names.append(
+            get("compound_name")
+            or get("compound_lm_id")
+            or get("compound_generic_id")
+            or "Unknown"
+        )
+    return kept, "; ".join(names)
+
+
+def _may_have_lm_main(raw_reaction: Any) -> bool:
+    """Cheap pre-filter on a raw reaction; malformed entries are kept so the
+    parse loop in check_reactions can report them."""
+    if not isinstance(raw_reaction, dict):
+        return True
+    for side in ("reactants", "products"):
+        for comp in raw_reaction.get(side) or ():
+            if not isinstance(comp, dict) or comp.get("compound_type") == "lm_main":
+                return True
+    return False
+
+
+def _post_batch(
+    api_url: str,
+    lm_ids: Tuple[str, ...],
+    search_type: str,
+    search_mode: str,
+    generic_reactions: bool,
+    timeout: int,
+) -> List[Dict[str, Any]]:
+    """POST one batch of LM IDs and return the reactions with lm_main components.
+
+    The body is streamed and filtered reaction by reaction, so reactions with
+    no lm_main reactants or products are never held in memory.
+    """
+    # Build payload matching the API used in the HTTP example (keys like "lmsd_ids")
+    payload = {
+        "search_mode": search_mode,
+        "search_type": search_type,
+        "generic_reactions": generic_reactions,
+        "lmsd_ids": list(lm_ids),
+        "search_source": "lipidmaps_py",
+    }
+    logger.debug("Reaction check payload: %s", payload)
+
+    response = _get_session().post(api_url, json=payload, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        # Log response body where available to help debugging 400/500 errors
+        body = None
+        try:
+            body = response.text
+        except Exception:
+            body = "<unavailable>"
+        logger.error(
+            "Reaction API returned HTTP %s: %s",
+            response.status_code,
+            body,
+        )
+        raise
+
+    try:
+        return [
+            raw_reaction
+            for raw_reaction in iter_json_array(response)
+            if _may_have_lm_main(raw_reaction)
+        ]
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+    finally:
+        response.close()
+
+
+@lru_cache(maxsize=REACTION_CACHE_SIZE)
+def _fetch_reactions(
+    api_url: str,
+    lm_ids: Tuple[str, ...],
+    search_type: str,
+    search_mode: str,
+    generic_reactions: bool,
+    timeout: int,
+) -> Tuple[Dict[str, Any], ...]:
+    """Fetch raw reactions for sorted, unique LM IDs, batching large requests.
+
+    Memoized per process on the full argument tuple, so repeated checks of the
+    same lipidome reuse the earlier payload. Failed requests raise and are not
+    cached. Callers must treat the returned dicts as read-only.
+    """
+    batches = [
+        lm_ids[i : i + REACTION_BATCH_SIZE]
+        for i in range(0, len(lm_ids), REACTION_BATCH_SIZE)
+    ]
+
+    def post(batch: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        return _post_batch(
+            api_url, batch, search_type, search_mode, generic_reactions, timeout
+        )
+
+    logger.info(
+        f"Sending {len(batches)} reaction check request(s) for {len(lm_ids)} LM IDs to {api_url}"
+    )
+    if len(batches) == 1:
+        return tuple(post(batches[0]))
+    workers = min(REACTION_MAX_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return tuple(_merge_batches(executor.map(post, batches)))
+
 
 class CompoundComponent(BaseModel):
     """Represents a compound in a reaction (reactant or product)."""
@@ -47,9 +213,17 @@ class ReactionData(BaseModel):
         return any(c.compound_type == "lm_main" for c in all_components)
 
     def filter_lm_main(self) -> "ReactionData":
-        """Return a new ReactionData with only lm_main components."""
+        """Return a new ReactionData with only lm_main components.
+
+        The components are already validated, so the result is built without
+        validating them again. A side with nothing filtered out keeps its list.
+        """
         filtered_reactants = [c for c in self.reactants if c.compound_type == "lm_main"]
+        if len(filtered_reactants) == len(self.reactants):
+            filtered_reactants = self.reactants
         filtered_products = [c for c in self.products if c.compound_type == "lm_main"]
+        if len(filtered_products) == len(self.products):
+            filtered_products = self.products
 
         # Generate reaction name from filtered components
         reactant_names = "; ".join(c.display_name() for c in filtered_reactants)
@@ -60,7 +234,7 @@ class ReactionData(BaseModel):
             else None
         )
 
-        return ReactionData(
+        return ReactionData.model_construct(
             reaction_id=self.reaction_id,
             reaction_name=reaction_name,
             reactants=filtered_reactants,
@@ -98,12 +272,18 @@ class ReactionChecker(BaseModel):
         """Initialize after model creation."""
         logger.info(f"Initialized ReactionChecker with URL: {self.api_url}")
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget reaction responses cached in memory by earlier checks."""
+        _fetch_reactions.cache_clear()
+
     def check_reactions(
         self,
         lm_ids: List[str],
         search_type: str = "lipids",
         search_mode: str = "default",
         generic_reactions: bool = True,
+        force_refresh: bool = False,
     ) -> ReactionResponse:
         """Check reactions for given LIPID MAPS IDs.
 
@@ -114,74 +294,60 @@ class ReactionChecker(BaseModel):
             search_type: Type of search (e.g. "lipids")
             search_mode: Mode string for the API (default: "default")
             generic_reactions: Whether to request generic reactions
+            force_refresh: Bypass the in-process response cache
 
         Returns:
             ReactionResponse with filtered reactions containing only lm_main components
         """
-        # Build payload matching the API used in the HTTP example (keys like "lmsd_ids")
-        payload = {
-            "search_mode": search_mode,
-            "search_type": search_type,
-            "generic_reactions": generic_reactions,
-            "lmsd_ids": lm_ids,
-            "search_source": "lipidmaps_py",
-        }
-        logger.debug("Reaction check payload: %s", payload)
+        # Sorted, de-duplicated IDs give stable request bodies and cache keys
+        lm_ids = tuple(sorted(set(lm_ids)))
+        if not lm_ids:
+            logger.info("No LM IDs supplied; skipping reaction check")
+            return ReactionResponse(reactions=[])
 
+        fetch = _fetch_reactions.__wrapped__ if force_refresh else _fetch_reactions
         try:
-            logger.info(f"Sending reaction check request for {len(lm_ids)} LM IDs to {self.api_url}")
-            response = requests.post(self.api_url, json=payload, timeout=self.timeout)
-            try:
-                response.raise_for_status()
-            except requests.HTTPError:
-                # Log response body where available to help debugging 400/500 errors
-                body = None
-                try:
-                    body = response.text
-                except Exception:
-                    body = "<unavailable>"
-                logger.error(
-                    "Reaction API returned HTTP %s: %s",
-                    response.status_code,
-                    body,
-                )
-                raise
-
-            raw_data = response.json()
-
-            # Parse raw data into ReactionData objects
+            raw_data = fetch(
+                self.api_url,
+                lm_ids,
+                search_type,
+                search_mode,
+                generic_reactions,
+                self.timeout,
+            )
+
+            # Parse raw data into ReactionData objects, keeping only lm_main
+            # components (equivalent to ReactionData.filter_lm_main)
             reactions = []
             for raw_reaction in raw_data:
                 try:
-                    # Parse reactants and products
-                    reactants = [
-                        CompoundComponent(**comp)
-                        for comp in raw_reaction.get("reactants", [])
-                    ]
-                    products = [
-                        CompoundComponent(**comp)
-                        for comp in raw_reaction.get("products", [])
-                    ]
-
-                    reaction = ReactionData(
-                        reactants=reactants,
-                        products=products,
-                        **{
-                            k: v
-                            for k, v in raw_reaction.items()
-                            if k not in ["reactants", "products"]
-                        },
-                    )
-
-                    # Filter to keep only lm_main components
-                    filtered_reaction = reaction.filter_lm_main()
+                    get = raw_reaction.get
+                    reactants, reactant_names = _lm_main_components(get("reactants"))
+                    products, product_names = _lm_main_components(get("products"))
 
                     # Only include if it has lm_main components
-                    if filtered_reaction.reactants or filtered_reaction.products:
-                        reactions.append(filtered_reaction)
+                    if not (reactants or products):
+                        continue
+
+                    # One validation call per reaction builds its nested
+                    # CompoundComponents too, rather than one call per compound
+                    reactions.append(
+                        ReactionData.model_validate(
+                            {
+                                "reaction_id": get("reaction_id"),
+                                "reaction_name": f"{reactant_names} -> {product_names}",
+                                "reactants": reactants,
+                                "products": products,
+                                "genes": get("genes") or [],
+                                "proteins": get("proteins") or [],
+                                "curations": get("curations") or [],
+                                "pathways": get("pathways") or [],
+                            }
+                        )
+                    )
 
                 except Exception as e:
-                    logger.warning(f"Failed to parse reaction: {e}")
+                    logger.warning("Failed to parse reaction: %s", e)
                     continue
 
             logger.info(f"Successfully retrieved {len(reactions)} reactions")
@@ -0,0 +1,73 @@
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+# Keys per SELECT; stays under SQLite's default bound-parameter limit
+_QUERY_CHUNK = 500
+
+
+class SQLiteCache:
+    """Persistent key -> JSON value store backed by a single SQLite table.
+
+    A connection is opened per call, so instances are safe to share between
+    threads and processes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        table: str = "cache",
+        max_age: Optional[float] = None,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.path = str(path)
+        self.table = table
+        # Entries older than this many seconds are treated as missing
+        self.max_age = max_age
+        with self._connect() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return decoded values for the keys present (and fresh) in the cache."""
+        keys = list(keys)
+        found: Dict[str, Any] = {}
+        min_ts = time.time() - self.max_age if self.max_age is not None else None
+        with self._connect() as conn:
+            for i in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value, ts FROM {self.table} WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, value, ts in rows:
+                    if min_ts is None or ts >= min_ts:
+                        found[key] = json.loads(value)
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store JSON-serializable values, replacing existing entries."""
+        if not items:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, ts) VALUES (?, ?, ?)",
+                [(key, json.dumps(value), now) for key, value in items.items()],
+            )
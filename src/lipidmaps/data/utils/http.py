@@ -0,0 +1,155 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_JSON_WHITESPACE = " \t\r\n"
+# The tail of a buffer that could be the start of a number or literal
+_PARTIAL_TOKEN = re.compile(r"[0-9A-Za-z+\-.]*\Z")
+
+
+def build_session(
+    pool_connections: int = 8,
+    pool_maxsize: int = 32,
+    retries: int = 3,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Session:
+    """Return a requests.Session with a pooled, retrying HTTPAdapter mounted.
+
+    Reusing one session keeps TCP/TLS connections alive between calls to the
+    same host instead of paying a fresh handshake per request. ``headers``
+    are added to every request made through the session.
+
+    Rate-limited (429) and 5xx responses are retried with exponential
+    backoff; a ``Retry-After`` header on the response overrides the backoff.
+    Connection, DNS and read failures are not retried, so an unreachable
+    host fails straight away.
+    """
+    retry = Retry(
+        total=None,
+        connect=0,
+        read=0,
+        other=0,
+        status=retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def iter_json_array(
+    response: requests.Response, chunk_size: int = 64 * 1024
+) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array as the body streams in.
+
+    Only the undecoded tail of the body is buffered, so callers can filter
+    elements without materialising the whole document. A body that is not
+    an array is decoded in full and yielded as a single element. Malformed
+    arrays raise ``json.JSONDecodeError``.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = response.iter_content(chunk_size=chunk_size)
+    buf = ""
+    pos = 0
+    done = False
+
+    def fill(want: int = 1) -> None:
+        # Read at least ``want`` more characters; growing by the size of the
+        # pending element keeps re-decoding a long element linear overall
+        nonlocal buf, pos, done
+        parts = [buf[pos:]]
+        size = 0
+        for chunk in chunks:
+            if chunk:
+                text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+                parts.append(text)
+                size += len(text)
+                if size >= want:
+                    break
+        else:
+            parts.append(utf8.decode(b"", final=True))
+            done = True
+        buf = "".join(parts)
+        pos = 0
+
+    def skip_whitespace() -> bool:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if done:
+                return False
+            fill()
+
+    def finish() -> None:
+        # Only whitespace may follow the closing bracket
+        nonlocal pos
+        pos += 1
+        if skip_whitespace():
+            raise json.JSONDecodeError("Extra data", buf, pos)
+
+    if not skip_whitespace():
+        return
+
+    if buf[pos] != "[":
+        while not done:
+            fill()
+        yield json.loads(buf[pos:])
+        return
+    pos += 1
+
+    if not skip_whitespace():
+        raise json.JSONDecodeError("Unterminated array", buf, pos)
+    if buf[pos] == "]":
+        finish()
+        return
+
+    while True:
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            # Only an error caused by running out of buffer is worth a refill
+            truncated = e.msg.startswith("Unterminated string") or _PARTIAL_TOKEN.match(
+                buf, e.pos
+            )
+            if done or not truncated:
+                raise
+            fill(len(buf) - pos)
+            continue
+        # A number or literal running into the buffer edge may still be incomplete
+        if not done and buf[end - 1] not in '"]}' and _PARTIAL_TOKEN.match(buf, end):
+            fill(len(buf) - pos)
+            continue
+        pos = end
+        yield item
+
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Unterminated array", buf, pos)
+        if buf[pos] == "]":
+            finish()
+            return
+        if buf[pos] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+        pos += 1
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Expecting value", buf, pos)
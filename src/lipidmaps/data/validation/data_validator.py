@@ -7,15 +7,42 @@ Validates structure, detects missing values, checks numeric ranges, and generate
 
 import logging
 import re
+import sys
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import Counter
 
+import numpy as np
+
 from ..ingestion.csv_reader import RawDataFrame
 
 logger = logging.getLogger(__name__)
 
+# Reports can hold one issue per malformed row, so issues and reports drop
+# their per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Lipid names that look like placeholders rather than real identifiers; the
+# alternatives are mutually exclusive, so one match classifies a name
+_SUSPICIOUS_NAME_RE = re.compile(
+    r"^(?:(?P<numeric>\d+$)|(?P<na>[Nn][Aa]$)|(?P<unknown>[Uu]nknown))"
+)
+# Match group -> description, in reporting order
+_SUSPICIOUS_NAME_KINDS = {
+    "numeric": "numeric only",
+    "na": "NA values",
+    "unknown": "unknown markers",
+}
+
+
+def _duplicates(values: List[str]) -> List[str]:
+    """Return the values occurring more than once, in first-occurrence order."""
+    # Unique input is the common case; building a set settles it without counting
+    if len(set(values)) == len(values):
+        return []
+    return [value for value, count in Counter(values).items() if count > 1]
+
 
 class IssueSeverity(Enum):
     """Severity levels for validation issues."""
@@ -26,7 +53,7 @@ class IssueSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationIssue:
     """Represents a single validation issue found in the data.
 
@@ -50,7 +77,7 @@ class ValidationIssue:
         return f"[{self.severity.value.upper()}] {self.category}: {self.message}{loc}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationReport:
     """Complete validation report for a dataset.
 
@@ -66,12 +93,10 @@ class ValidationReport:
     @property
     def passed(self) -> bool:
         """Check if validation passed (no critical or error issues)."""
-        critical_or_error = [
-            issue
+        return not any(
+            issue.severity in (IssueSeverity.CRITICAL, IssueSeverity.ERROR)
             for issue in self.issues
-            if issue.severity in (IssueSeverity.CRITICAL, IssueSeverity.ERROR)
-        ]
-        return len(critical_or_error) == 0
+        )
 
     @property
     def has_warnings(self) -> bool:
@@ -82,6 +107,15 @@ class ValidationReport:
         """Get all issues of a specific severity."""
         return [issue for issue in self.issues if issue.severity == severity]
 
+    def issues_by_severity(self) -> Dict[IssueSeverity, List[ValidationIssue]]:
+        """Group all issues by severity in one pass, keyed in IssueSeverity order."""
+        buckets: Dict[IssueSeverity, List[ValidationIssue]] = {
+            severity: [] for severity in IssueSeverity
+        }
+        for issue in self.issues:
+            buckets[issue.severity].append(issue)
+        return buckets
+
     def get_issues_by_category(self, category: str) -> List[ValidationIssue]:
         """Get all issues in a specific category."""
         return [issue for issue in self.issues if issue.category == category]
@@ -115,11 +149,10 @@ class ValidationReport:
         print(f"Total Issues: {len(self.issues)}")
 
         # Count by severity
-        severity_counts = Counter(issue.severity for issue in self.issues)
-        for severity in IssueSeverity:
-            count = severity_counts.get(severity, 0)
-            if count > 0:
-                print(f"  {severity.value.capitalize()}: {count}")
+        by_severity = self.issues_by_severity()
+        for severity, issues in by_severity.items():
+            if issues:
+                print(f"  {severity.value.capitalize()}: {len(issues)}")
 
         # Print issues grouped by severity
         for severity in [
@@ -128,7 +161,7 @@ class ValidationReport:
             IssueSeverity.WARNING,
             IssueSeverity.INFO,
         ]:
-            issues = self.get_issues_by_severity(severity)
+            issues = by_severity[severity]
             if issues:
                 print(f"\n{severity.value.upper()} Issues:")
                 for issue in issues:
@@ -143,6 +176,20 @@ class ValidationReport:
         print("=" * 80 + "\n")
 
 
+@dataclass
+class _ColumnScan:
+    """Column cells and per-column counts gathered in one pass over the data.
+
+    Shared by the checks in ``DataValidator.validate`` so each column is read
+    once rather than once per check.
+    """
+
+    names: List[str]  # lipid name column
+    cells: Dict[str, List[str]]  # sample column -> cells
+    missing: Dict[str, int]  # sample column -> empty cell count
+    has_value: np.ndarray  # rows with at least one sample value
+
+
 class DataValidator:
     """Comprehensive data quality validator for lipid datasets.
 
@@ -175,15 +222,23 @@ class DataValidator:
         self.allow_missing_values = allow_missing_values
         self.max_missing_percent = max_missing_percent
 
-    @staticmethod
-    def _get_cell_value(row: Dict[str, Any], column: str) -> str:
-        """Return a normalized string value for a cell, handling None gracefully."""
-        value = row.get(column, "")
-        if value is None:
-            return ""
-        if isinstance(value, str):
-            return value.strip()
-        return str(value).strip()
+    def _scan(self, raw_df: RawDataFrame) -> _ColumnScan:
+        """Read every column once for the checks below."""
+        fieldnames = raw_df.fieldnames
+        # Column cells come back stripped, so they are used as they are
+        names = raw_df.column(fieldnames[0]) if fieldnames else []
+        cells: Dict[str, List[str]] = {}
+        missing: Dict[str, int] = {}
+        has_value = np.zeros(raw_df.row_count, dtype=bool)
+        for col in fieldnames[1:]:
+            if col in missing:
+                continue
+            values = raw_df.column(col)
+            present = np.fromiter(map(bool, values), dtype=bool, count=len(values))
+            cells[col] = values
+            missing[col] = len(present) - int(np.count_nonzero(present))
+            has_value |= present
+        return _ColumnScan(names=names, cells=cells, missing=missing, has_value=has_value)
 
     def validate(self, raw_df: RawDataFrame) -> ValidationReport:
         """Run complete validation on raw data frame.
@@ -197,15 +252,16 @@ class DataValidator:
         logger.info("Starting data validation")
         report = ValidationReport()
 
-        # Run all validation checks
+        # Run all validation checks; the column checks share one scan
+        scan = self._scan(raw_df)
         self._validate_structure(raw_df, report)
-        self._validate_missing_values(raw_df, report)
-        self._validate_numeric_values(raw_df, report)
-        self._validate_lipid_names(raw_df, report)
-        self._validate_consistency(raw_df, report)
+        self._validate_missing_values(raw_df, report, scan)
+        self._validate_numeric_values(raw_df, report, scan)
+        self._validate_lipid_names(raw_df, report, scan)
+        self._validate_consistency(raw_df, report, scan)
 
         # Generate summary
-        report.summary = self._generate_summary(raw_df, report)
+        report.summary = self._generate_summary(raw_df, report, scan)
 
         logger.info(
             f"Validation complete: {len(report.issues)} issues found, "
@@ -242,9 +298,7 @@ class DataValidator:
             )
 
         # Check for duplicate column names
-        duplicates = [
-            name for name, count in Counter(raw_df.fieldnames).items() if count > 1
-        ]
+        duplicates = _duplicates(raw_df.fieldnames)
         if duplicates:
             report.issues.append(
                 ValidationIssue(
@@ -298,40 +352,40 @@ class DataValidator:
             )
 
     def _validate_missing_values(
-        self, raw_df: RawDataFrame, report: ValidationReport
+        self,
+        raw_df: RawDataFrame,
+        report: ValidationReport,
+        scan: Optional[_ColumnScan] = None,
     ) -> None:
         """Check for missing values in the dataset."""
         if raw_df.is_empty():
             return
 
-        name_col = raw_df.fieldnames[0]
+        scan = scan or self._scan(raw_df)
         sample_cols = raw_df.fieldnames[1:]
+        row_count = raw_df.row_count
 
-        # Check for missing lipid names
-        missing_names = 0
-        for i, row in enumerate(raw_df.rows):
-            name = self._get_cell_value(row, name_col)
-            if not name:
-                missing_names += 1
-                report.issues.append(
-                    ValidationIssue(
-                        severity=IssueSeverity.ERROR,
-                        category="missing_data",
-                        message="Missing lipid name",
-                        location={"row": i + 1},
-                    )
+        # Check for missing lipid names; reported once, listing the first rows
+        missing_name_rows = [i + 1 for i, name in enumerate(scan.names) if not name]
+        if missing_name_rows:
+            report.issues.append(
+                ValidationIssue(
+                    severity=IssueSeverity.ERROR,
+                    category="missing_data",
+                    message=f"Missing lipid name in {len(missing_name_rows)} rows",
+                    location={
+                        "rows": missing_name_rows[:20],
+                        "total": len(missing_name_rows),
+                    },
                 )
+            )
 
         # Check for missing values in sample columns
         for col in sample_cols:
-            missing_count = 0
-            for i, row in enumerate(raw_df.rows):
-                value = self._get_cell_value(row, col)
-                if not value:
-                    missing_count += 1
+            missing_count = scan.missing[col]
 
             if missing_count > 0:
-                missing_percent = (missing_count / len(raw_df.rows)) * 100
+                missing_percent = (missing_count / row_count) * 100
 
                 if missing_percent > self.max_missing_percent:
                     report.issues.append(
@@ -339,7 +393,7 @@ class DataValidator:
                             severity=IssueSeverity.ERROR,
                             category="missing_data",
                             message=f'Excessive missing values in column "{col}": '
-                            f"{missing_percent:.1f}% ({missing_count}/{len(raw_df.rows)})",
+                            f"{missing_percent:.1f}% ({missing_count}/{row_count})",
                             location={"column": col, "missing_count": missing_count},
                             suggestion=f"Maximum allowed is {self.max_missing_percent}%",
                         )
@@ -350,41 +404,48 @@ class DataValidator:
                             severity=IssueSeverity.WARNING,
                             category="missing_data",
                             message=f'Missing values in column "{col}": '
-                            f"{missing_percent:.1f}% ({missing_count}/{len(raw_df.rows)})",
+                            f"{missing_percent:.1f}% ({missing_count}/{row_count})",
                             location={"column": col, "missing_count": missing_count},
                         )
                     )
 
     def _validate_numeric_values(
-        self, raw_df: RawDataFrame, report: ValidationReport
+        self,
+        raw_df: RawDataFrame,
+        report: ValidationReport,
+        scan: Optional[_ColumnScan] = None,
     ) -> None:
         """Validate that sample columns contain valid numeric values."""
         if raw_df.is_empty():
             return
 
+        scan = scan or self._scan(raw_df)
         sample_cols = raw_df.fieldnames[1:]
 
         for col in sample_cols:
             non_numeric = []
-            negative_values = []
-            zero_values = 0
-            values = []
-
-            for i, row in enumerate(raw_df.rows):
-                value_str = self._get_cell_value(row, col)
-                if not value_str:
-                    continue  # Skip missing values (handled separately)
-
-                try:
-                    value = float(value_str)
-                    values.append(value)
-
-                    if value < 0:
-                        negative_values.append((i + 1, value))
-                    elif value == 0:
-                        zero_values += 1
-                except ValueError:
-                    non_numeric.append((i + 1, value_str))
+            parsed = raw_df.numeric_column(col)
+            if parsed is not None:
+                # Every non-empty cell parsed, including literal "NaN" cells
+                value_count = len(parsed) - scan.missing[col]
+            else:
+                parsed = np.full(raw_df.row_count, np.nan)
+                value_count = 0
+                for i, value_str in enumerate(scan.cells[col]):
+                    if not value_str:
+                        continue  # Skip missing values (handled separately)
+                    try:
+                        parsed[i] = float(value_str)
+                        value_count += 1
+                    except ValueError:
+                        non_numeric.append((i + 1, value_str))
+
+            # Sign and zero checks run on the whole column at once
+            negative_rows = np.flatnonzero(parsed < 0)
+            negative_values = [
+                (i + 1, parsed[i].item()) for i in negative_rows[:3].tolist()
+            ]
+            zero_values = int(np.count_nonzero(parsed == 0))
 
             # Report non-numeric values
             if non_numeric:
@@ -400,44 +461,45 @@ class DataValidator:
                 )
 
             # Report negative values
-            if negative_values:
-                sample = negative_values[:3]
+            if len(negative_rows):
                 report.issues.append(
                     ValidationIssue(
                         severity=IssueSeverity.WARNING,
                         category="invalid_value",
-                        message=f'Negative values in column "{col}": {len(negative_values)} found',
-                        location={"column": col, "examples": sample},
+                        message=f'Negative values in column "{col}": {len(negative_rows)} found',
+                        location={"column": col, "examples": negative_values},
                         suggestion="Quantitation values should typically be positive",
                     )
                 )
 
             # Report excessive zeros
-            if values and zero_values / len(values) > 0.5:
-                zero_percent = (zero_values / len(values)) * 100
+            if value_count and zero_values / value_count > 0.5:
+                zero_percent = (zero_values / value_count) * 100
                 report.issues.append(
                     ValidationIssue(
                         severity=IssueSeverity.WARNING,
                         category="data_quality",
                         message=f'High proportion of zero values in column "{col}": '
-                        f"{zero_percent:.1f}% ({zero_values}/{len(values)})",
+                        f"{zero_percent:.1f}% ({zero_values}/{value_count})",
                         location={"column": col},
                     )
                 )
 
     def _validate_lipid_names(
-        self, raw_df: RawDataFrame, report: ValidationReport
+        self,
+        raw_df: RawDataFrame,
+        report: ValidationReport,
+        scan: Optional[_ColumnScan] = None,
     ) -> None:
         """Validate lipid name formats and check for duplicates."""
         if raw_df.is_empty():
             return
 
-        name_col = raw_df.fieldnames[0]
-        names = [row.get(name_col, "").strip() for row in raw_df.rows]
-        names = [n for n in names if n]  # Remove empty
+        scan = scan or self._scan(raw_df)
+        names = [n for n in scan.names if n]  # Remove empty
 
         # Check for duplicates
-        duplicates = [name for name, count in Counter(names).items() if count > 1]
+        duplicates = _duplicates(names)
         if duplicates:
             report.issues.append(
                 ValidationIssue(
@@ -461,15 +523,15 @@ class DataValidator:
                 )
             )
 
-        # Check for common invalid patterns
-        suspicious_patterns = [
-            (r"^\d+$", "numeric only"),
-            (r"^[Nn][Aa]$", "NA values"),
-            (r"^[Uu]nknown", "unknown markers"),
-        ]
-
-        for pattern, description in suspicious_patterns:
-            matches = [name for name in names if re.match(pattern, name)]
+        # Check for common invalid patterns, one regex match per name
+        suspicious: Dict[str, List[str]] = {kind: [] for kind in _SUSPICIOUS_NAME_KINDS}
+        match = _SUSPICIOUS_NAME_RE.match
+        for name in names:
+            m = match(name)
+            if m:
+                suspicious[m.lastgroup].append(name)
+        for kind, description in _SUSPICIOUS_NAME_KINDS.items():
+            matches = suspicious[kind]
             if matches:
                 report.issues.append(
                     ValidationIssue(
@@ -481,20 +543,18 @@ class DataValidator:
                 )
 
     def _validate_consistency(
-        self, raw_df: RawDataFrame, report: ValidationReport
+        self,
+        raw_df: RawDataFrame,
+        report: ValidationReport,
+        scan: Optional[_ColumnScan] = None,
     ) -> None:
         """Check for data consistency issues."""
         if raw_df.is_empty():
             return
 
         # Check for rows with all missing values
-        sample_cols = raw_df.fieldnames[1:]
-        empty_rows = []
-
-        for i, row in enumerate(raw_df.rows):
-            values = [self._get_cell_value(row, col) for col in sample_cols]
-            if not any(values):
-                empty_rows.append(i + 1)
+        scan = scan or self._scan(raw_df)
+        empty_rows = (np.flatnonzero(~scan.has_value) + 1).tolist()
 
         if empty_rows:
             report.issues.append(
@@ -508,19 +568,19 @@ class DataValidator:
             )
 
     def _generate_summary(
-        self, raw_df: RawDataFrame, report: ValidationReport
+        self,
+        raw_df: RawDataFrame,
+        report: ValidationReport,
+        scan: Optional[_ColumnScan] = None,
     ) -> Dict[str, Any]:
         """Generate validation summary statistics."""
+        scan = scan or self._scan(raw_df)
         sample_cols = raw_df.fieldnames[1:]
 
         # Calculate data completeness
-        total_cells = len(raw_df.rows) * len(sample_cols)
-        missing_cells = 0
-
-        for row in raw_df.rows:
-            for col in sample_cols:
-                if not self._get_cell_value(row, col):
-                    missing_cells += 1
+        row_count = raw_df.row_count
+        total_cells = row_count * len(sample_cols)
+        missing_cells = sum(scan.missing[col] for col in sample_cols)
 
         completeness = (
             ((total_cells - missing_cells) / total_cells * 100)
@@ -528,18 +588,21 @@ class DataValidator:
             else 0
         )
 
+        # One pass over the issues for all per-severity counts
+        severity_counts = Counter(issue.severity for issue in report.issues)
+        critical = severity_counts[IssueSeverity.CRITICAL]
+        errors = severity_counts[IssueSeverity.ERROR]
+
         return {
-            "total_rows": len(raw_df.rows),
+            "total_rows": row_count,
             "total_columns": len(raw_df.fieldnames),
             "sample_columns": len(sample_cols),
             "data_completeness_percent": round(completeness, 2),
-            "validation_passed": report.passed,
-            "critical_issues": len(
-                report.get_issues_by_severity(IssueSeverity.CRITICAL)
-            ),
-            "errors": len(report.get_issues_by_severity(IssueSeverity.ERROR)),
-            "warnings": len(report.get_issues_by_severity(IssueSeverity.WARNING)),
-            "info": len(report.get_issues_by_severity(IssueSeverity.INFO)),
+            "validation_passed": critical == 0 and errors == 0,
+            "critical_issues": critical,
+            "errors": errors,
+            "warnings": severity_counts[IssueSeverity.WARNING],
+            "info": severity_counts[IssueSeverity.INFO],
         }
 
     def _validate_row_structure(
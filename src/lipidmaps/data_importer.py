@@ -9,7 +9,7 @@ import logging
 from typing import Union, Optional, List, Dict, Any
 from pathlib import Path
 
-from pydantic import BaseModel, Field, computed_field, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, ConfigDict
 
 from .data.data_manager import DataManager
 from .data.models.sample import LipidDataset, QuantifiedLipid
@@ -17,6 +17,63 @@ from .data.models.sample import LipidDataset, QuantifiedLipid
 logger = logging.getLogger(__name__)
 
 
+def _trigrams(text: str) -> set:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _LipidNameIndex:
+    """Name lookups over a list of QuantifiedLipid objects.
+
+    Built from the names present at construction time; exact matches are a
+    dict hit and substring searches only scan lipids sharing every trigram
+    of the query. ``is_current`` compares the lipids and their names with
+    those indexed, so replaced, added or renamed lipids trigger a rebuild.
+    """
+
+    def __init__(self, lipids: List[QuantifiedLipid]):
+        # A copy, which also keeps the indexed lipids alive so the ids in
+        # ``key`` cannot be reused by new objects
+        self.lipids = list(lipids)
+        self.size = len(lipids)
+        self.key = self._key(lipids)
+        # First lipid matching each name, mirroring a front-to-back scan
+        self.by_name: Dict[str, QuantifiedLipid] = {}
+        self.lowered: List[tuple] = []
+        self.trigrams: Dict[str, set] = {}
+        for i, lipid in enumerate(lipids):
+            lowered = []
+            for name in (lipid.input_name, lipid.standardized_name):
+                if name:
+                    self.by_name.setdefault(name, lipid)
+                    lowered.append(name.lower())
+            self.lowered.append(tuple(lowered))
+            for name in lowered:
+                for gram in _trigrams(name):
+                    self.trigrams.setdefault(gram, set()).add(i)
+
+    @staticmethod
+    def _key(lipids: List[QuantifiedLipid]) -> List[tuple]:
+        return [(id(q), q.input_name, q.standardized_name) for q in lipids]
+
+    def is_current(self, lipids: List[QuantifiedLipid]) -> bool:
+        return self._key(lipids) == self.key
+
+    def find(self, query: str) -> List[QuantifiedLipid]:
+        query = query.lower()
+        if len(query) < 3:
+            candidates = range(self.size)
+        else:
+            postings = sorted(
+                (self.trigrams.get(gram, set()) for gram in _trigrams(query)), key=len
+            )
+            candidates = sorted(set.intersection(*postings))
+        return [
+            self.lipids[i]
+            for i in candidates
+            if any(query in name for name in self.lowered[i])
+        ]
+
+
 class LipidData(BaseModel):
     """High-level interface for lipid data imported from CSV files.
 
@@ -35,6 +92,7 @@ class LipidData(BaseModel):
         default_factory=lambda: LipidDataset(samples=[], lipids=[])
     )
     manager: Optional[DataManager] = Field(default=None)
+    _name_index: Optional[_LipidNameIndex] = PrivateAttr(default=None)
 
     def model_post_init(self, __context: Any) -> None:
         """Initialize manager if not provided."""
@@ -98,14 +156,7 @@ class LipidData(BaseModel):
         """
         if isinstance(lipid, str):
             # Find lipid by name
-            lipid_obj = next(
-                (
-                    sample_lipid
-                    for sample_lipid in self.dataset.lipids
-                    if sample_lipid.input_name == lipid or sample_lipid.standardized_name == lipid
-                ),
-                None,
-            )
+            lipid_obj = self.get_lipid_by_name(lipid)
             if lipid_obj is None:
                 return None
             return lipid_obj.values.get(sample)
@@ -121,14 +172,27 @@ class LipidData(BaseModel):
         Returns:
             QuantifiedLipid object or None if not found
         """
-        return next(
-            (
-                sample_lipid
-                for sample_lipid in self.dataset.lipids
-                if sample_lipid.input_name == name or sample_lipid.standardized_name == name
-            ),
-            None,
-        )
+        return self._lipid_index().by_name.get(name)
+
+    def find_lipids(self, query: str) -> List[QuantifiedLipid]:
+        """Find lipids whose input or standardized name contains ``query``.
+
+        Matching is case-insensitive and results keep dataset order.
+
+        Args:
+            query: Substring to search for
+
+        Returns:
+            List of matching QuantifiedLipid objects
+        """
+        return self._lipid_index().find(query)
+
+    def _lipid_index(self) -> _LipidNameIndex:
+        """Return the name index, rebuilding it if any lipid or name has changed."""
+        lipids = self.dataset.lipids
+        if self._name_index is None or not self._name_index.is_current(lipids):
+            self._name_index = _LipidNameIndex(lipids)
+        return self._name_index
 
     def get_lipids_by_class(self, lipid_class: str) -> List[QuantifiedLipid]:
         """Get all lipids belonging to a specific class.
@@ -189,6 +253,16 @@ class LipidData(BaseModel):
             return self.manager.dataset_dict()
         return self.model_dump()
 
+    def to_json(self) -> str:
+        """Serialize the dataset to a JSON string.
+
+        Returns:
+            JSON document with the same content as ``to_dict``
+        """
+        if self.manager:
+            return self.manager.dataset_json()
+        return self.model_dump_json()
+
     # TODO: Future methods for reactions integration
     def get_reactions(self, species: str = "human", complete: bool = True):
         """
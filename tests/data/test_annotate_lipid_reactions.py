@@ -49,5 +49,25 @@ class TestAnnotateLipidsWithReactions(unittest.TestCase):
             reaction_ids = [r["reaction_id"] for r in lipid.reactions]
             self.assertTrue(any(rid in ["R1", "R2"] for rid in reaction_ids))
 
+    def test_annotate_lipids_with_reactions_details_opt_in(self):
+        reactions = [
+            Reaction(
+                reaction_id=1,
+                reaction_name="PC to LPC",
+                reactants=[{"compound_lm_id": "LMGP01010001"}],
+                products=[{"compound_lm_id": "LMGP02010001"}],
+                type="class-level",
+                pathway_id=None,
+                enzyme_id=None,
+            )
+        ]
+        self.manager.annotate_lipids_with_reactions(reactions)
+        self.assertEqual([r.reaction_id for r in self.lipids[0].reactions], ["1"])
+        self.assertIsNone(self.lipids[0].reactions[0].details)
+
+        self.manager.annotate_lipids_with_reactions(reactions, keep_details=True)
+        self.assertEqual(self.lipids[1].reactions[0].role, "product")
+        self.assertEqual(self.lipids[1].reactions[0].details["reaction_name"], "PC to LPC")
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,11 @@ Tests for CSVIngestion class
 import unittest
 import tempfile
 import logging
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from unittest import mock
+
+import numpy as np
 
 from lipidmaps.data.ingestion import CSVIngestion, RawDataFrame, CSVFormat
 from lipidmaps.data.validation.data_validator import DataValidator, IssueSeverity
@@ -81,6 +85,33 @@ class TestCSVIngestion(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_delimiter_detection_ignores_quoted_delimiters(self):
+        """Test that delimiters inside quoted fields do not win detection."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write('lipid,"note; a; b; c",sample1\n')
+            f.write('PC(16:0/18:1),"x; y; z; w",1.5\n')
+            f.write('PE(18:0/20:4),"x; y; z; w",2.5\n')
+            temp_path = Path(f.name)
+
+        try:
+            self.assertEqual(self.ingestion._detect_delimiter(temp_path), ",")
+        finally:
+            temp_path.unlink()
+
+    def test_latin1_file_auto_detection(self):
+        """Test that format and delimiter detection handle non-UTF-8 files."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".csv", delete=False) as f:
+            f.write("lipid;échantillon1\nPC(16:0/18:1);1.5\n".encode("latin-1"))
+            temp_path = Path(f.name)
+
+        try:
+            raw_df = self.ingestion.read_csv(temp_path)
+
+            self.assertEqual(raw_df.fieldnames, ["lipid", "échantillon1"])
+            self.assertEqual(raw_df.metadata["delimiter"], ";")
+        finally:
+            temp_path.unlink()
+
     def test_raw_dataframe_properties(self):
         """Test RawDataFrame properties."""
         test_file = self.test_data_dir / "small_demo.csv"
@@ -92,6 +123,20 @@ class TestCSVIngestion(unittest.TestCase):
         self.assertFalse(raw_df.is_empty())
         self.assertIsInstance(raw_df.metadata, dict)
 
+    def test_raw_dataframe_dump_includes_rows(self):
+        """Test that rows built from the frame are serialized first, as a field."""
+        test_file = self.test_data_dir / "small_demo.csv"
+        raw_df = self.ingestion.read_csv(test_file)
+
+        dumped = raw_df.model_dump()
+
+        self.assertEqual(
+            list(dumped),
+            ["rows", "fieldnames", "labels", "format_type", "metadata", "row_count", "column_count"],
+        )
+        self.assertEqual(dumped["rows"], raw_df.rows)
+        self.assertEqual(RawDataFrame(**dumped).model_dump_json(), raw_df.model_dump_json())
+
     def test_get_column_info(self):
         """Test getting column information."""
         test_file = self.test_data_dir / "small_demo.csv"
@@ -117,6 +162,66 @@ class TestCSVIngestion(unittest.TestCase):
         for raw_df in results:
             self.assertIsInstance(raw_df, RawDataFrame)
 
+    def test_read_batch_parallel_keeps_order(self):
+        """Test that parallel batch reads keep input order and skip failures."""
+        test_files = [
+            self.test_data_dir / "input_inconsistent_fields.csv",
+            self.test_data_dir / "missing.csv",
+            self.test_data_dir / "small_demo.csv",
+        ]
+
+        results = self.ingestion.read_batch(test_files, max_workers=2)
+
+        self.assertEqual(
+            [r.metadata["source_file"] for r in results],
+            [str(test_files[0]), str(test_files[2])],
+        )
+        self.assertEqual(results[0].row_count, 3)
+
+    def test_read_batch_parallel_forwards_worker_logs(self):
+        """Test that log records from worker processes reach this process."""
+        test_files = [
+            self.test_data_dir / "input_inconsistent_fields.csv",
+            self.test_data_dir / "small_demo.csv",
+        ]
+
+        with self.assertLogs("lipidmaps.data.ingestion.csv_reader", level="INFO") as logs:
+            self.ingestion.read_batch(test_files, max_workers=2)
+
+        for path in test_files:
+            self.assertIn(f"Reading CSV file: {path}", "\n".join(logs.output))
+
+    def test_read_batch_falls_back_when_pool_breaks(self):
+        """Test that a broken worker pool falls back to reading in-process."""
+        test_files = [
+            self.test_data_dir / "input_inconsistent_fields.csv",
+            self.test_data_dir / "small_demo.csv",
+        ]
+
+        with mock.patch.object(
+            CSVIngestion, "_read_parallel", side_effect=BrokenProcessPool("boom")
+        ):
+            results = self.ingestion.read_batch(test_files, max_workers=2)
+
+        self.assertEqual(
+            [r.metadata["source_file"] for r in results], [str(p) for p in test_files]
+        )
+
+    def test_read_batch_single_worker_reads_in_process(self):
+        """Test that one resolved worker skips the process pool."""
+        test_files = [
+            self.test_data_dir / "input_inconsistent_fields.csv",
+            self.test_data_dir / "small_demo.csv",
+        ]
+
+        with mock.patch.object(CSVIngestion, "_read_parallel") as parallel:
+            results = self.ingestion.read_batch(test_files, max_workers=1)
+            with mock.patch("os.cpu_count", return_value=1):
+                self.ingestion.read_batch(test_files)
+
+        parallel.assert_not_called()
+        self.assertEqual(len(results), 2)
+
     def test_custom_delimiter(self):
         """Test reading CSV with custom delimiter."""
         # Create CSV with semicolon delimiter
@@ -152,6 +257,103 @@ class TestCSVIngestion(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_rectangular_csv_builds_rows_lazily(self):
+        """Test that regular files keep a column DataFrame and build rows lazily."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("lipid,sample1,sample2\n")
+            f.write(" PC(16:0/18:1) ,123.45,NA\n")
+            f.write("TAG(16:0/18:1/18:2),,678.90\n")
+            temp_path = Path(f.name)
+
+        try:
+            raw_df = self.ingestion.read_csv(temp_path)
+
+            self.assertIsNotNone(raw_df.frame)
+            self.assertEqual(raw_df.row_count, 2)
+            self.assertEqual(raw_df.column("sample2"), ["NA", "678.90"])
+            self.assertIs(raw_df.column("sample2"), raw_df.column("sample2"))
+            self.assertIsNone(raw_df.numeric_column("sample2"))
+            sample1 = raw_df.numeric_column("sample1")
+            self.assertEqual(sample1[0], 123.45)
+            self.assertTrue(np.isnan(sample1[1]))
+            self.assertEqual(
+                raw_df.rows[0],
+                {"lipid": "PC(16:0/18:1)", "sample1": "123.45", "sample2": "NA"},
+            )
+            self.assertEqual(raw_df.rows[1]["sample1"], "")
+        finally:
+            temp_path.unlink()
+
+    def test_rectangular_csv_keeps_cell_text(self):
+        """Test that numeric-looking cells come back as written in the file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("lipid,sample1,sample2\n")
+            f.write("PC(16:0/18:1),007,1e5\n")
+            f.write("TAG(16:0/18:1/18:2),0.1000000000000000055511,3 \n")
+            temp_path = Path(f.name)
+
+        try:
+            raw_df = self.ingestion.read_csv(temp_path)
+            chunk = next(self.ingestion.read_csv_chunks(temp_path))
+
+            self.assertEqual(raw_df.column("sample1"), ["007", "0.1000000000000000055511"])
+            self.assertEqual(raw_df.column("sample2"), ["1e5", "3"])
+            self.assertEqual(chunk.rows, raw_df.rows)
+            self.assertEqual(raw_df.numeric_column("sample2").tolist(), [100000.0, 3.0])
+        finally:
+            temp_path.unlink()
+
+    def test_column_normalizes_row_cells(self):
+        """Test that columns built from rows are stripped strings."""
+        raw_df = RawDataFrame(
+            rows=[{"lipid": " PC(16:0/18:1) ", "sample1": None}, {"lipid": "CE(18:1)", "sample1": 2.5}],
+            fieldnames=["lipid", "sample1"],
+            format_type=CSVFormat.STANDARD,
+        )
+
+        self.assertEqual(raw_df.column("lipid"), ["PC(16:0/18:1)", "CE(18:1)"])
+        self.assertEqual(raw_df.column("sample1"), ["", "2.5"])
+
+    def test_irregular_csv_falls_back_to_row_reader(self):
+        """Test that short and long rows skip pandas and are recorded."""
+        test_file = self.test_data_dir / "input_inconsistent_fields.csv"
+
+        raw_df = self.ingestion.read_csv(test_file)
+
+        self.assertEqual(raw_df.column("dr_young_3"), ["", "0.3", "0.6"])
+        issues = raw_df.metadata["row_structure_issues"]
+        self.assertEqual(issues[1], {"missing_columns": ["dr_young_3"]})
+        self.assertEqual(issues[2], {"extra_fields": ["0.4"]})
+
+    def test_read_csv_chunks(self):
+        """Test reading a file as fixed-size RawDataFrame chunks."""
+        test_file = self.test_data_dir / "small_demo.csv"
+        whole = self.ingestion.read_csv(test_file)
+
+        chunks = list(self.ingestion.read_csv_chunks(test_file, chunksize=2))
+
+        self.assertEqual(sum(c.row_count for c in chunks), whole.row_count)
+        self.assertTrue(all(c.row_count <= 2 for c in chunks))
+        self.assertEqual(chunks[1].metadata["row_offset"], 2)
+        self.assertEqual(chunks[0].fieldnames, whole.fieldnames)
+        name_col = whole.fieldnames[0]
+        self.assertEqual(
+            [v for c in chunks for v in c.column(name_col)], whole.column(name_col)
+        )
+
+    def test_read_csv_chunks_irregular_rows(self):
+        """Test that chunked reads number structure issues across the file."""
+        test_file = self.test_data_dir / "input_inconsistent_fields.csv"
+
+        chunks = list(self.ingestion.read_csv_chunks(test_file, chunksize=2))
+
+        self.assertEqual([c.row_count for c in chunks], [2, 1])
+        self.assertEqual(
+            chunks[0].metadata["row_structure_issues"],
+            {1: {"missing_columns": ["dr_young_3"]}, 2: {"extra_fields": ["0.4"]}},
+        )
+        self.assertEqual(chunks[1].metadata["row_structure_issues"], {})
+
 
 class TestCSVStructureValidation(unittest.TestCase):
     """Validate CSV structural rules."""
@@ -190,6 +392,10 @@ class TestCSVStructureValidation(unittest.TestCase):
         self.assertGreater(
             len(name_issues), 0, "Expected missing lipid names to be reported"
         )
+        name_issue = next(
+            issue for issue in name_issues if issue.message.startswith("Missing lipid name")
+        )
+        self.assertEqual(name_issue.location, {"rows": [2, 4], "total": 2})
         self.assertFalse(report.passed)
 
     def test_inconsistent_field_counts_detected(self):
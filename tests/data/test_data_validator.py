@@ -145,6 +145,9 @@ class TestDataValidator(unittest.TestCase):
         # Test methods
         warnings = report.get_issues_by_severity(IssueSeverity.WARNING)
         self.assertIsInstance(warnings, list)
+        by_severity = report.issues_by_severity()
+        self.assertEqual(list(by_severity), list(IssueSeverity))
+        self.assertEqual(by_severity[IssueSeverity.WARNING], warnings)
 
         report_dict = report.to_dict()
         self.assertIsInstance(report_dict, dict)
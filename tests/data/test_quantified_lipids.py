@@ -1,9 +1,14 @@
+import json
 import os
-import csv
 import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
 
 from lipidmaps.data.data_manager import DataManager
-from lipidmaps.data.models.sample import QuantifiedLipid
+from lipidmaps.data.models.sample import QuantifiedLipid, LipidDataset, SampleMetadata
+from lipidmaps.data.models.refmet import RefMetResult
 
 
 class TestPopulateManager(unittest.TestCase):
@@ -16,12 +21,10 @@ class TestPopulateManager(unittest.TestCase):
         csv_path = os.path.join(os.path.dirname(__file__), "inputs", "small_demo.csv")
         assert os.path.exists(csv_path), f"CSV not found: {csv_path}"
 
-        with open(csv_path, newline="") as fh:
-            reader = csv.DictReader(fh)
-            rows = list(reader)
-            fieldnames = reader.fieldnames or []
+        df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        fieldnames = list(df.columns)
 
-        assert rows, "Input CSV is empty"
+        assert not df.empty, "Input CSV is empty"
         assert (
             len(fieldnames) >= 2
         ), "CSV must have at least one lipid column and one sample column"
@@ -29,22 +32,19 @@ class TestPopulateManager(unittest.TestCase):
         first_col = fieldnames[0]
         sample_ids = fieldnames[1:]
 
-        # build quantified lipids
+        # build quantified lipids: convert all sample cells in one vectorized
+        # pass; empty and non-numeric cells become NaN and are skipped
+        names = df[first_col].str.strip()
+        values_mat = (
+            df[sample_ids].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+        )
+        sample_arr = np.array(sample_ids, dtype=object)
         lipid_data = []
-        for row in rows:
-            lipid_species = (row.get(first_col) or "").strip()
+        for lipid_species, row in zip(names, values_mat):
             if not lipid_species:
                 continue
-            values = {}
-            for sid in sample_ids:
-                raw = (row.get(sid) or "").strip()
-                if raw == "":
-                    continue
-                try:
-                    values[sid] = float(raw)
-                except ValueError:
-                    # skip non-numeric cells
-                    continue
+            mask = ~np.isnan(row)
+            values = dict(zip(sample_arr[mask], row[mask].tolist()))
             lipid_data.append(QuantifiedLipid(input_name=lipid_species, values=values))
 
         # Use DataManager to process the CSV and get the dataset
@@ -58,3 +58,196 @@ class TestPopulateManager(unittest.TestCase):
         assert isinstance(dataset.lipids[0].values, dict)
         # ensure DataManager initialized and dataset populated
         assert hasattr(manager, "process_csv")
+
+    def test_dataset_to_matrix(self):
+        samples = [
+            SampleMetadata(sample_id="S1", group="A"),
+            SampleMetadata(sample_id="S2", group="B"),
+        ]
+        lipids = [
+            QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S1": 1.0, "S2": 2.0}),
+            QuantifiedLipid(input_name="TAG(54:3)", values={"S2": 4.0, "S9": 9.0}),
+        ]
+        matrix = LipidDataset(samples=samples, lipids=lipids).to_matrix()
+
+        assert matrix.shape == (2, 2)
+        assert matrix[0].tolist() == [1.0, 2.0]
+        assert np.isnan(matrix[1, 0])
+        assert matrix[1, 1] == 4.0
+
+    def test_zscore(self):
+        lipid = QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S1": 1.0, "S2": 2.0, "S3": 3.0})
+        scores = lipid.zscore()
+
+        assert list(scores) == ["S1", "S2", "S3"]
+        np.testing.assert_allclose(list(scores.values()), [-1.224744871, 0.0, 1.224744871])
+        assert QuantifiedLipid(input_name="x", values={"S1": 2.0, "S2": 2.0}).zscore() == {"S1": 0.0, "S2": 0.0}
+
+    def test_dataset_zscore_matrix_matches_zscore(self):
+        samples = [SampleMetadata(sample_id=sid, group="A") for sid in ("S1", "S2", "S3")]
+        lipids = [
+            QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S1": 1.0, "S2": 2.0, "S3": 4.0}),
+            QuantifiedLipid(input_name="TAG(54:3)", values={"S1": 5.0, "S3": 5.0}),
+            QuantifiedLipid(input_name="SM(d18:1/16:0)", values={}),
+        ]
+        matrix = LipidDataset(samples=samples, lipids=lipids).zscore_matrix()
+
+        np.testing.assert_allclose(matrix[0], list(lipids[0].zscore().values()))
+        assert matrix[1, 0] == 0.0 and matrix[1, 2] == 0.0
+        assert np.isnan(matrix[1, 1])
+        assert np.isnan(matrix[2]).all()
+
+        # A NaN value makes every score NaN, in both
+        with_nan = QuantifiedLipid(input_name="x", values={"S1": np.nan, "S2": 1.0, "S3": 3.0})
+        matrix = LipidDataset(samples=samples, lipids=[with_nan]).zscore_matrix()
+        assert np.isnan(matrix).all()
+        assert np.isnan(list(with_nan.zscore().values())).all()
+
+    def test_dataset_get_grouped_data(self):
+        samples = [
+            SampleMetadata(sample_id="S1", group="A"),
+            SampleMetadata(sample_id="S2", group="B"),
+            SampleMetadata(sample_id="S3", group="A"),
+        ]
+        lipids = [
+            QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S1": 1.0, "S2": 2.0, "S3": 3.0}),
+            QuantifiedLipid(input_name="TAG(54:3)", values={"S2": 4.0}, lm_id="LMGL03010001"),
+        ]
+        grouped = LipidDataset(samples=samples, lipids=lipids).get_grouped_data()
+
+        assert [lipid.values for lipid in grouped["A"]] == [{"S1": 1.0, "S3": 3.0}, {}]
+        assert [lipid.values for lipid in grouped["B"]] == [{"S2": 2.0}, {"S2": 4.0}]
+        assert grouped["B"][1].input_name == "TAG(54:3)"
+        assert grouped["B"][1].lm_id is None
+
+    def test_from_parsed_matches_validated(self):
+        parsed = QuantifiedLipid.from_parsed("PC(16:0/18:1)", {"S1": 1.0})
+        validated = QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S1": 1.0})
+
+        assert parsed.model_dump() == validated.model_dump()
+        parsed.lm_id = "LMGP01010001"
+        assert parsed.lm_id == "LMGP01010001"
+
+    def test_extract_quantified_lipids_from_rows(self):
+        rows = [
+            {"Name": " PC(16:0/18:1) ", "S1": " 1.5 ", "S2": "", "S3": "x"},
+            {"Name": "", "S1": "2", "S2": "3", "S3": "4"},
+            {"Name": "TAG(54:3)", "S1": "n/a", "S2": ""},
+            {"Name": "SM(d18:1/16:0)", "S1": "1e3", "S2": "4", "S3": "5"},
+        ]
+        column_info = {"column_types": {"S1": "numeric", "S2": "numeric", "S3": "text"}}
+
+        sample_ids = ["".join(["S", str(i)]) for i in (1, 2, 3)]
+
+        lipids = DataManager().extract_quantified_lipids(
+            rows, "Name", sample_ids, column_info
+        )
+
+        assert [q.input_name for q in lipids] == ["PC(16:0/18:1)", "SM(d18:1/16:0)"]
+        assert lipids[0].values == {"S1": 1.5}
+        assert lipids[1].values == {"S1": 1000.0, "S2": 4.0}
+        # Every lipid reuses the given sample id objects as its keys
+        assert all(next(iter(q.values)) is sample_ids[0] for q in lipids)
+
+    def test_extract_quantified_lipids_keeps_literal_nan(self):
+        frame = pd.DataFrame(
+            {"Name": ["PC(16:0/18:1)", "TAG(54:3)"], "S1": ["NaN", ""], "S2": ["2", "nan"]}
+        )
+
+        lipids = DataManager().extract_quantified_lipids(frame, "Name", ["S1", "S2"])
+
+        # A "NaN" cell parses to a NaN value; only empty cells are left out
+        assert list(lipids[0].values) == ["S1", "S2"]
+        assert np.isnan(lipids[0].values["S1"])
+        assert list(lipids[1].values) == ["S2"]
+        assert np.isnan(lipids[1].values["S2"])
+
+    def test_process_csv_stream_matches_process_csv(self):
+        csv_path = os.path.join(os.path.dirname(__file__), "inputs", "small_demo.csv")
+
+        # Keep the comparison offline: RefMet annotation is covered elsewhere
+        with mock.patch.object(DataManager, "annotate_lipids_with_refmet"):
+            whole = DataManager().process_csv(csv_path)
+            streamed = DataManager().process_csv_stream(csv_path, chunksize=2)
+
+        assert [s.sample_id for s in streamed.samples] == [s.sample_id for s in whole.samples]
+        assert [(q.input_name, q.values) for q in streamed.lipids] == [
+            (q.input_name, q.values) for q in whole.lipids
+        ]
+        # Sample metadata and lipid values share one key object per sample
+        sample_ids = {s.sample_id: s.sample_id for s in whole.samples}
+        assert all(sid is sample_ids[sid] for q in whole.lipids for sid in q.values)
+
+    def test_apply_refmet(self):
+        lipid = QuantifiedLipid.from_parsed("PC 34:1", {"S1": 1.0})
+        result = RefMetResult(
+            input_name="PC 34:1",
+            standardized_name="PC 34:1",
+            lm_id="LMGP01010005",
+            exact_mass=759.578,
+            sub_class="PC",
+        )
+
+        lipid.apply_refmet(result)
+
+        assert lipid.standardized_by == "RefMet"
+        assert lipid.lm_id_found_by == "RefMet"
+        assert lipid.mass == 759.578
+        assert lipid.sub_class == "PC"
+        assert {"lm_id", "mass", "standardized_by"} <= lipid.model_fields_set
+
+        unmatched = QuantifiedLipid.from_parsed("X", {"S1": 1.0})
+        unmatched.apply_refmet(RefMetResult(input_name="X"))
+        assert unmatched.lm_id is None and unmatched.lm_id_found_by is None
+
+    def test_dataset_as_dataframe(self):
+        manager = DataManager()
+        manager.dataset = LipidDataset(
+            samples=[SampleMetadata(sample_id="S2", group="B"), SampleMetadata(sample_id="S1", group="A")],
+            lipids=[
+                QuantifiedLipid(input_name="PC(16:0/18:1)", values={"S2": 2.0}),
+                QuantifiedLipid(input_name="TAG(54:3)", values={"S1": 1.0, "S2": 4.0}),
+            ],
+        )
+
+        df = manager.dataset_as_dataframe()
+
+        assert list(df.columns) == ["S2", "S1"]
+        assert df.index.name == "lipid"
+        assert df.loc["TAG(54:3)", "S1"] == 1.0
+        assert np.isnan(df.loc["PC(16:0/18:1)", "S1"])
+
+        manager.dataset = LipidDataset(samples=[], lipids=[])
+        assert manager.dataset_as_dataframe().empty
+
+    def test_group_statistics_keep_nan_values(self):
+        manager = DataManager()
+        manager.dataset = LipidDataset(
+            samples=[SampleMetadata(sample_id="S1", group="A"), SampleMetadata(sample_id="S2", group="A")],
+            lipids=[
+                QuantifiedLipid(input_name="PC 16:0", values={"S1": float("nan"), "S2": 1.0}),
+                QuantifiedLipid(input_name="PE 18:0", values={"S1": float("nan")}),
+                QuantifiedLipid(input_name="TG 54:3", values={"S1": 2.0, "S2": 4.0}),
+            ],
+        )
+
+        stats = manager.get_group_statistics()["A"]
+
+        # A NaN value counts as present, as a literal "NaN" cell is kept
+        assert stats["lipid_coverage"] == 3
+        assert np.isnan(stats["mean_values"]["PC 16:0"])
+        assert np.isnan(stats["std_values"]["PC 16:0"])
+        assert np.isnan(stats["mean_values"]["PE 18:0"])
+        assert stats["mean_values"]["TG 54:3"] == 3.0
+        assert stats["std_values"]["TG 54:3"] == 1.0
+
+    def test_dataset_json_matches_dataset_dict(self):
+        manager = DataManager()
+        assert manager.dataset_json() == "{}"
+
+        manager.dataset = LipidDataset(
+            samples=[SampleMetadata(sample_id="S1", group="S")],
+            lipids=[QuantifiedLipid.from_parsed("PC 34:1", {"S1": 1.5})],
+        )
+
+        assert json.loads(manager.dataset_json()) == manager.dataset_dict()
@@ -0,0 +1,37 @@
+import pytest
+
+from lipidmaps.data.utils.cache import SQLiteCache
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteCache(path, table="names")
+    cache.set_many({"PC 16:0": {"lm_id": "LM1"}, "TG": {"lm_id": None}})
+    cache.set_many({"PC 16:0": {"lm_id": "LM2"}})
+
+    reopened = SQLiteCache(path, table="names")
+    assert reopened.get_many(["PC 16:0", "TG", "missing"]) == {
+        "PC 16:0": {"lm_id": "LM2"},
+        "TG": {"lm_id": None},
+    }
+
+
+def test_sqlite_cache_many_keys(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    items = {f"name{i}": i for i in range(1200)}
+    cache.set_many(items)
+
+    assert cache.get_many(items) == items
+
+
+def test_sqlite_cache_max_age(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    SQLiteCache(path).set_many({"a": 1})
+
+    assert SQLiteCache(path, max_age=3600).get_many(["a"]) == {"a": 1}
+    assert SQLiteCache(path, max_age=-1).get_many(["a"]) == {}
+
+
+def test_sqlite_cache_rejects_bad_table(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteCache(tmp_path / "cache.sqlite", table="x; DROP TABLE y")
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import lipidmaps
 from lipidmaps import LipidData
+from lipidmaps.data.models.sample import LipidDataset, QuantifiedLipid
 
 
 logging.basicConfig(
@@ -236,6 +237,34 @@ class TestDataImporter(unittest.TestCase):
         stats = data.get_group_statistics()
         self.assertIsInstance(stats, dict)
 
+    def test_find_lipids(self):
+        """Test case-insensitive substring search and name lookups."""
+        lipids = [
+            QuantifiedLipid(input_name="PC(16:0/18:1)", standardized_name="PC 16:0_18:1", values={"S1": 1.0}),
+            QuantifiedLipid(input_name="LPC(16:0)", values={"S1": 2.0}),
+            QuantifiedLipid(input_name="TG 54:3", values={"S1": 3.0}),
+        ]
+        data = LipidData(dataset=LipidDataset(samples=[], lipids=lipids))
+
+        self.assertEqual(data.find_lipids("pc"), lipids[:2])
+        self.assertEqual(data.find_lipids("16:0_18"), lipids[:1])
+        self.assertEqual(data.find_lipids("xyz"), [])
+        self.assertIs(data.get_lipid_by_name("PC 16:0_18:1"), lipids[0])
+        self.assertEqual(data.get_value_for_lipid("TG 54:3", "S1"), 3.0)
+
+        # Renamed, replaced and appended lipids are picked up
+        lipids[1].standardized_name = "LysoPC 16:0"
+        self.assertEqual(data.find_lipids("lyso"), [lipids[1]])
+        self.assertIs(data.get_lipid_by_name("LysoPC 16:0"), lipids[1])
+        replaced = lipids[0]
+        data.dataset.lipids[0] = QuantifiedLipid(input_name="TG 54:3", values={"S1": 4.0})
+        self.assertEqual(data.find_lipids("tg"), [data.dataset.lipids[0], lipids[2]])
+        self.assertIsNone(data.get_lipid_by_name("PC(16:0/18:1)"))
+        self.assertEqual(data.get_value_for_lipid("TG 54:3", "S1"), 4.0)
+        self.assertNotIn(replaced, data.find_lipids("pc"))
+        data.dataset.lipids.append(QuantifiedLipid(input_name="PE(18:0)", values={}))
+        self.assertEqual(data.find_lipids("pe("), data.dataset.lipids[3:])
+
     def test_reactions_not_implemented(self):
         """Test that reaction methods raise NotImplementedError."""
         data = lipidmaps.import_data(str(self.test_file))
@@ -69,3 +69,23 @@ def test_fill_missing_lm_ids_handles_lmsd_error(monkeypatch):
     updated = mgr.fill_missing_lm_ids_from_lmsd()
     assert updated == 0
     assert mgr.dataset.lipids[0].lm_id is None
+
+
+def test_fill_missing_lm_ids_queries_each_name_once(monkeypatch):
+    lipids = [
+        QuantifiedLipid(input_name='PC 34:1', values={}),
+        QuantifiedLipid(input_name='TG 52:2', values={}),
+        QuantifiedLipid(input_name='PC 34:1', values={}),
+    ]
+    mgr = DataManager()
+    mgr.dataset = LipidDataset(samples=[], lipids=lipids)
+
+    def fake_get(names):
+        assert names == ['PC 34:1', 'TG 52:2']
+        return [{'input_name': 'PC 34:1', 'lm_id': 'LMGP01'}, {'input_name': 'TG 52:2', 'lm_id': None}]
+
+    monkeypatch.setattr(LMSD, 'get_lm_ids_by_name', fake_get)
+
+    updated = mgr.fill_missing_lm_ids_from_lmsd()
+    assert updated == 2
+    assert [q.lm_id for q in mgr.dataset.lipids] == ['LMGP01', None, 'LMGP01']
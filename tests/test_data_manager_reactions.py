@@ -0,0 +1,78 @@
+from lipidmaps.data import data_manager
+from lipidmaps.data.data_manager import DataManager
+from lipidmaps.data.models.sample import QuantifiedLipid, SampleMetadata, LipidDataset
+from lipidmaps.data.reaction_checker import CompoundComponent, ReactionData, ReactionResponse
+
+
+def make_dataset(lm_ids):
+    samples = [SampleMetadata(sample_id="S1", group="g1")]
+    lipids = [
+        QuantifiedLipid(input_name=f"L{i}", values={"S1": 1.0}, lm_id=lm_id)
+        for i, lm_id in enumerate(lm_ids)
+    ]
+    return LipidDataset(samples=samples, lipids=lipids)
+
+
+def fake_checker(monkeypatch, calls):
+    def check_reactions(self, lm_ids, **kwargs):
+        calls.append(sorted(lm_ids))
+        # reaction 1 links LM1 and LM2; every other ID gets its own reaction
+        reactions = [ReactionData(reaction_id=1)] if {"LM1", "LM2"} & set(lm_ids) else []
+        reactions += [ReactionData(reaction_id=int(i[2:]) * 10) for i in lm_ids]
+        return ReactionResponse(reactions=reactions)
+
+    monkeypatch.setattr(data_manager.ReactionChecker, "check_reactions", check_reactions)
+
+
+def test_fetch_reactions_for_lm_ids(monkeypatch):
+    calls = []
+    fake_checker(monkeypatch, calls)
+    mgr = DataManager()
+    mgr.dataset = make_dataset(["LM1", None, "LM3"])
+
+    reactions = mgr.fetch_reactions_for_lm_ids()
+
+    assert calls == [["LM1", "LM3"]]
+    assert sorted(r.reaction_id for r in reactions) == [1, 10, 30]
+
+
+def test_fetch_reactions_reuses_prefetch(monkeypatch):
+    calls = []
+    fake_checker(monkeypatch, calls)
+    mgr = DataManager()
+    ds = make_dataset(["LM1", None, "LM3"])
+
+    prefetched = mgr.prefetch_reactions(ds)
+    ds.lipids[1].lm_id = "LM2"
+    reactions = mgr.fetch_reactions_for_lm_ids(ds, prefetched=prefetched)
+
+    assert calls == [["LM1", "LM3"], ["LM2"]]
+    assert sorted(r.reaction_id for r in reactions) == [1, 10, 20, 30]
+
+
+def test_fetch_reactions_prefetch_covers_all(monkeypatch):
+    calls = []
+    fake_checker(monkeypatch, calls)
+    mgr = DataManager()
+    ds = make_dataset(["LM1"])
+
+    reactions = mgr.fetch_reactions_for_lm_ids(ds, prefetched=mgr.prefetch_reactions(ds))
+
+    assert calls == [["LM1"]]
+    assert sorted(r.reaction_id for r in reactions) == [1, 10]
+
+
+def test_build_reactions_tree_from_reactions():
+    reaction = ReactionData(
+        reaction_id=7,
+        reaction_name="A -> B",
+        reactants=[CompoundComponent(compound_name="A"), CompoundComponent(compound_lm_id="LM1")],
+        products=[CompoundComponent(compound_name="B")],
+    )
+
+    tree = DataManager().build_reactions_tree_from_reactions([reaction])
+
+    assert sorted(tree.edges) == [("A", "B"), ("LM1", "B")]
+    assert tree.edges["A", "B"] == {"reaction_id": 7, "reaction_name": "A -> B"}
+    tree.edges["A", "B"]["reaction_id"] = 8
+    assert tree.edges["LM1", "B"]["reaction_id"] == 7
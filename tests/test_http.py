@@ -0,0 +1,126 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from lipidmaps.data.utils.http import build_session, iter_json_array
+
+
+class ChunkedResponse:
+    def __init__(self, body, size):
+        self.body = body
+        self.size = size
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), self.size):
+            yield self.body[i : i + self.size]
+
+
+def test_build_session_retries_rate_limits():
+    session = build_session(retries=5, headers={"Accept": "application/json"})
+
+    retry = session.get_adapter("https://example.org").max_retries
+    assert retry.status == 5
+    assert retry.connect == 0 and retry.read == 0
+    assert 429 in retry.status_forcelist
+    assert 503 in retry.status_forcelist
+    assert retry.respect_retry_after_header
+    assert "POST" in retry.allowed_methods
+    assert session.headers["Accept"] == "application/json"
+
+
+@pytest.fixture
+def status_server():
+    """Local server answering with the queued status codes, then 200."""
+    statuses = []
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(statuses.pop(0) if statuses else 200)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/", statuses, hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_build_session_retries_status_codes(status_server):
+    url, statuses, hits = status_server
+    statuses.extend([429, 503])
+
+    response = build_session(retries=3).get(url, timeout=5)
+
+    assert response.status_code == 200
+    assert len(hits) == 3
+
+
+def test_build_session_does_not_retry_connection_errors():
+    # A port nothing listens on: the connection is refused straight away
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    start = time.monotonic()
+    with pytest.raises(requests.ConnectionError):
+        build_session(retries=3).get(f"http://127.0.0.1:{port}/", timeout=5)
+    # Retried connections would sleep through the backoff first
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.parametrize("size", [1, 3, 64 * 1024])
+def test_iter_json_array_across_chunks(size):
+    data = [{"name": "PC 16:0/18:1 é", "ids": [1, 2]}, 12345, "x", None, []]
+    body = json.dumps(data, ensure_ascii=False).encode()
+
+    assert list(iter_json_array(ChunkedResponse(body, size))) == data
+
+
+def test_iter_json_array_non_array_body():
+    body = b'{"error": "bad request"}'
+
+    assert list(iter_json_array(ChunkedResponse(body, 4))) == [{"error": "bad request"}]
+    assert list(iter_json_array(ChunkedResponse(b"  ", 4))) == []
+
+
+def test_iter_json_array_truncated():
+    with pytest.raises(ValueError):
+        list(iter_json_array(ChunkedResponse(b'[{"a": 1}, {"b":', 4)))
+
+
+@pytest.mark.parametrize(
+    "body", [b"[1,,2]", b"[,1]", b"[1 2]", b"[1,]", b"[1] 2", b'[{"a": 1 "b": 2}]']
+)
+@pytest.mark.parametrize("size", [1, 64 * 1024])
+def test_iter_json_array_malformed(body, size):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(ChunkedResponse(body, size)))
+
+
+def test_iter_json_array_fails_fast_on_syntax_error():
+    consumed = []
+
+    class CountingResponse(ChunkedResponse):
+        def iter_content(self, chunk_size):
+            for chunk in super().iter_content(chunk_size):
+                consumed.append(chunk)
+                yield chunk
+
+    body = b'[{"a": 1 "b": 2}, ' + b"0, " * 10000 + b"0]"
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(CountingResponse(body, 16)))
+    # The error is raised without reading the rest of the body
+    assert len(consumed) < 5
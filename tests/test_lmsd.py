@@ -27,6 +27,11 @@ class FakeResponse:
         return self._text
 
 
+class FakeSession:
+    def __init__(self, post):
+        self.post = post
+
+
 def test_get_lm_ids_by_name_json(monkeypatch):
     sample = [
         {
@@ -52,7 +57,7 @@ def test_get_lm_ids_by_name_json(monkeypatch):
     def fake_post(*args, **kwargs):
         return FakeResponse(status_code=200, text=json.dumps(sample), json_data=sample)
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
 
     res = LMSD.get_lm_ids_by_name(["Butyrylcarnitine", "Cholesterol"])
     assert isinstance(res, list)
@@ -61,6 +66,24 @@ def test_get_lm_ids_by_name_json(monkeypatch):
     assert res[1]['lm_id'] == 'LMST01010001'
 
 
+def test_get_lm_ids_by_name_tsv_short_rows(monkeypatch):
+    header = '\t'.join(['Input_Name', 'abbrev_chains', 'lm_id'])
+    tsv = header + '\nPC 34:1\t2\tLMGP01010005\nUnknown\tx\n'
+
+    def fake_post(*args, **kwargs):
+        return FakeResponse(status_code=200, text=tsv, json_data=ValueError('no json'))
+
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
+
+    res = LMSD.get_lm_ids_by_name(["PC 34:1", "Unknown"])
+    assert res[0]['input_name'] == 'PC 34:1'
+    assert res[0]['abbrev_chains'] == 2.0
+    assert res[0]['lm_id'] == 'LMGP01010005'
+    assert res[1]['abbrev_chains'] is None
+    assert res[1]['lm_id'] is None
+    assert res[1]['name'] is None
+
+
 def test_get_lm_ids_by_name_tsv_fallback(monkeypatch):
     header = '\t'.join(['input_name', 'matched_field', 'name', 'sys_name', 'abbrev', 'abbrev_chains', 'lm_id'])
     row1 = '\t'.join(['Butyrylcarnitine', 'name', 'Butyrylcarnitine', '3-(butanoyloxy)-4-(trimethylazaniumyl)butanoate', 'CAR 4:0', '', 'LMFA07070054'])
@@ -70,7 +93,7 @@ def test_get_lm_ids_by_name_tsv_fallback(monkeypatch):
     def fake_post(*args, **kwargs):
         return FakeResponse(status_code=200, text=tsv, json_data=ValueError('no json'))
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
 
     res = LMSD.get_lm_ids_by_name(["Butyrylcarnitine", "Cholesterol"])
     assert isinstance(res, list)
@@ -83,7 +106,7 @@ def test_get_lm_ids_by_name_empty_response(monkeypatch):
     def fake_post(*args, **kwargs):
         return FakeResponse(status_code=200, text='', json_data=ValueError('no json'))
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
 
     res = LMSD.get_lm_ids_by_name(['NoMatch'])
     assert res == []
@@ -93,9 +116,40 @@ def test_get_lm_ids_by_name_request_exception(monkeypatch):
     def fake_post(*args, **kwargs):
         raise requests.RequestException('boom')
 
-    monkeypatch.setattr(requests, 'post', fake_post)
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
 
     res = LMSD.get_lm_ids_by_name(['X'])
     assert isinstance(res, dict)
     assert 'error' in res
     assert 'boom' in res['error']
+
+
+def test_get_lm_ids_by_name_batches_in_order(monkeypatch):
+    calls = []
+
+    def fake_post(*args, **kwargs):
+        names = kwargs['json']['names']
+        calls.append(names)
+        data = [{"input_name": n, "lm_id": f"LM_{n}"} for n in names]
+        return FakeResponse(status_code=200, text=json.dumps(data), json_data=data)
+
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
+    monkeypatch.setattr(LMSD, 'BATCH_SIZE', 2)
+
+    names = ['A', 'B', 'C', 'D', 'E']
+    res = LMSD.get_lm_ids_by_name(names)
+    assert sorted(len(c) for c in calls) == [1, 2, 2]
+    assert [r['lm_id'] for r in res] == [f"LM_{n}" for n in names]
+
+
+def test_get_lm_ids_by_name_batch_error(monkeypatch):
+    def fake_post(*args, **kwargs):
+        if 'C' in kwargs['json']['names']:
+            raise requests.RequestException('boom')
+        return FakeResponse(status_code=200, text='[]', json_data=[])
+
+    monkeypatch.setattr(LMSD, '_SESSION', FakeSession(fake_post))
+    monkeypatch.setattr(LMSD, 'BATCH_SIZE', 2)
+
+    res = LMSD.get_lm_ids_by_name(['A', 'B', 'C'])
+    assert res == {'error': 'boom'}
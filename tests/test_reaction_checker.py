@@ -0,0 +1,202 @@
+import json
+import warnings
+
+import pytest
+import requests
+
+from lipidmaps.data import reaction_checker
+from lipidmaps.data.models.reaction import Reaction
+from lipidmaps.data.reaction_checker import CompoundComponent, ReactionChecker, ReactionData
+
+
+@pytest.fixture(autouse=True)
+def clear_reaction_cache():
+    ReactionChecker.clear_cache()
+    yield
+    ReactionChecker.clear_cache()
+
+
+def make_reaction(reaction_id, reactant_id, product_id, extra_type="lm_main"):
+    return {
+        "reaction_id": reaction_id,
+        "reactants": [
+            {"compound_type": "lm_main", "compound_lm_id": reactant_id, "compound_name": reactant_id},
+            {"compound_type": "generic", "compound_name": "H2O"},
+        ],
+        "products": [
+            {"compound_type": extra_type, "compound_lm_id": product_id, "compound_name": product_id},
+        ],
+    }
+
+
+class FakeResponse:
+    def __init__(self, json_data, status_code=200):
+        self._json_data = json_data
+        self.status_code = status_code
+        self.text = str(json_data)
+
+    def json(self):
+        return self._json_data
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        body = json.dumps(self._json_data).encode()
+        # Small chunks so decoding has to resume across chunk boundaries
+        for i in range(0, len(body), 7):
+            yield body[i : i + 7]
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class FakeSession:
+    def __init__(self, handler):
+        self.handler = handler
+        self.payloads = []
+
+    def post(self, url, json=None, timeout=None, **kwargs):
+        self.payloads.append(json)
+        return self.handler(json)
+
+
+def make_checker(monkeypatch, handler):
+    session = FakeSession(handler)
+    monkeypatch.setattr(reaction_checker, "_get_session", lambda: session)
+    return ReactionChecker(base_url="http://example.org"), session
+
+
+def test_check_reactions_filters_lm_main(monkeypatch):
+    checker, session = make_checker(
+        monkeypatch, lambda payload: FakeResponse([make_reaction(1, "LM1", "LM2")])
+    )
+
+    response = checker.check_reactions(["LM2", "LM1", "LM1"])
+
+    assert session.payloads[0]["lmsd_ids"] == ["LM1", "LM2"]
+    assert response.error is None
+    assert len(response.reactions) == 1
+    reaction = response.reactions[0]
+    assert [c.compound_lm_id for c in reaction.reactants] == ["LM1"]
+    assert reaction.reaction_name == "LM1 -> LM2"
+
+
+def test_filter_lm_main_matches_check_reactions_parsing():
+    reaction = ReactionData.model_validate(make_reaction(1, "LM1", "LM2"))
+
+    filtered = reaction.filter_lm_main()
+
+    assert [c.compound_lm_id for c in filtered.reactants] == ["LM1"]
+    assert filtered.products is reaction.products
+    assert filtered.reaction_name == "LM1 -> LM2"
+    assert filtered.model_dump() == ReactionData(
+        reaction_id=1,
+        reaction_name="LM1 -> LM2",
+        reactants=filtered.reactants,
+        products=reaction.products,
+    ).model_dump()
+
+
+def test_check_reactions_batches_and_deduplicates(monkeypatch):
+    monkeypatch.setattr(reaction_checker, "REACTION_BATCH_SIZE", 2)
+
+    def handler(payload):
+        # reaction 1 is returned for every batch
+        ids = payload["lmsd_ids"]
+        reaction_id = int(ids[0][2:]) * 10
+        return FakeResponse([make_reaction(1, "LM1", "LM2"), make_reaction(reaction_id, ids[0], ids[-1])])
+
+    checker, session = make_checker(monkeypatch, handler)
+
+    response = checker.check_reactions(["LM5", "LM4", "LM3", "LM2", "LM1"])
+
+    assert sorted(len(p["lmsd_ids"]) for p in session.payloads) == [1, 2, 2]
+    assert sorted(r.reaction_id for r in response.reactions) == [1, 10, 30, 50]
+
+
+def test_check_reactions_drops_reactions_without_lm_main(monkeypatch):
+    reaction = make_reaction(1, "LM1", "LM2")
+    reaction["reactants"] = reaction["reactants"][1:]
+    reaction["products"][0]["compound_type"] = "generic"
+    checker, _ = make_checker(monkeypatch, lambda payload: FakeResponse([reaction]))
+
+    assert checker.check_reactions(["LM1"]).reactions == []
+
+
+def test_check_reactions_http_error(monkeypatch):
+    checker, _ = make_checker(monkeypatch, lambda payload: FakeResponse([], status_code=500))
+
+    response = checker.check_reactions(["LM1"])
+
+    assert response.reactions == []
+    assert "500" in response.error
+
+
+def test_check_reactions_caches_responses(monkeypatch):
+    checker, session = make_checker(
+        monkeypatch, lambda payload: FakeResponse([make_reaction(1, "LM1", "LM2")])
+    )
+
+    first = checker.check_reactions(["LM1", "LM2"])
+    second = checker.check_reactions(["LM2", "LM1", "LM2"])
+    assert len(session.payloads) == 1
+    assert [r.reaction_id for r in second.reactions] == [r.reaction_id for r in first.reactions]
+
+    checker.check_reactions(["LM1", "LM2"], force_refresh=True)
+    assert len(session.payloads) == 2
+
+    checker.check_reactions(["LM1", "LM2"], generic_reactions=False)
+    assert len(session.payloads) == 3
+
+    ReactionChecker.clear_cache()
+    checker.check_reactions(["LM1", "LM2"])
+    assert len(session.payloads) == 4
+
+
+def test_check_reactions_does_not_cache_errors(monkeypatch):
+    statuses = [500, 200]
+    checker, session = make_checker(
+        monkeypatch,
+        lambda payload: FakeResponse([make_reaction(1, "LM1", "LM2")], status_code=statuses.pop(0)),
+    )
+
+    assert checker.check_reactions(["LM1"]).error is not None
+    assert checker.check_reactions(["LM1"]).error is None
+    assert len(session.payloads) == 2
+
+
+def test_reaction_to_dict_serializes_components():
+    component = CompoundComponent(compound_type="lm_main", compound_lm_id="LM1")
+    reaction = Reaction(
+        1, "LM1 -> LM2", "species-level", None, None,
+        reactants=component, products=[{"compound_lm_id": "LM2"}],
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        data = reaction.to_dict()
+
+    assert data["reactants"] == [component.model_dump()]
+    assert data["products"] == [{"compound_lm_id": "LM2"}]
+
+
+def test_check_reactions_invalid_json(monkeypatch):
+    response = FakeResponse([])
+    response.iter_content = lambda chunk_size=1, decode_unicode=False: iter([b'[{"reaction_id": '])
+    checker, _ = make_checker(monkeypatch, lambda payload: response)
+
+    result = checker.check_reactions(["LM1"])
+
+    assert result.reactions == []
+    assert result.error
+
+
+def test_session_requests_compressed_json(monkeypatch):
+    monkeypatch.setattr(reaction_checker, "_SESSION", None)
+
+    session = reaction_checker._get_session()
+
+    assert session.headers["Accept"] == "application/json"
+    assert "gzip" in session.headers["Accept-Encoding"]
@@ -0,0 +1,207 @@
+import pytest
+import requests
+
+from lipidmaps.data.models.refmet import RefMet, RefMetResult
+
+
+HEADER = "\t".join(["Input name", "Standardized name", "LM_ID", "Sub class"])
+
+
+def fake_tsv(names):
+    rows = [HEADER]
+    for name in names:
+        rows.append("\t".join([name, f"STD {name}", f"LM_{name}", "PC"]))
+    return "\n".join(rows) + "\n"
+
+
+@pytest.fixture(autouse=True)
+def clear_refmet_cache():
+    RefMet.clear_cache()
+    yield
+    RefMet.clear_cache()
+
+
+def test_validate_metabolite_names_splits_into_batches(monkeypatch):
+    calls = []
+
+    def fake_post(names):
+        calls.append(list(names))
+        return fake_tsv(names)
+
+    monkeypatch.setattr(RefMet, "BATCH_SIZE", 2)
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(fake_post))
+
+    names = ["A", "B", "C", "D", "E"]
+    results = RefMet.validate_metabolite_names(names)
+
+    assert sorted(len(c) for c in calls) == [1, 2, 2]
+    assert [r.input_name for r in results] == names
+    assert all(isinstance(r, RefMetResult) for r in results)
+    assert results[4].standardized_name == "STD E"
+    assert results[4].lm_id == "LM_E"
+
+
+def test_validate_metabolite_names_fills_unmatched(monkeypatch):
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(lambda names: fake_tsv(names[:1])))
+
+    results = RefMet.validate_metabolite_names(["A", "Unknown"])
+
+    assert results[0].lm_id == "LM_A"
+    assert results[1].input_name == "Unknown"
+    assert results[1].standardized_name is None
+
+
+def test_validate_metabolite_names_empty_response(monkeypatch):
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(lambda names: ""))
+
+    assert RefMet.validate_metabolite_names(["A"]) == []
+
+
+def test_validate_metabolite_names_request_exception(monkeypatch):
+    def fake_post(names):
+        raise requests.RequestException("boom")
+
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(fake_post))
+
+    res = RefMet.validate_metabolite_names(["A"])
+    assert isinstance(res, dict)
+    assert "boom" in res["error"]
+
+
+def test_validate_metabolite_names_counts_duplicates(monkeypatch):
+    calls = []
+
+    def fake_post(names):
+        calls.append(list(names))
+        return fake_tsv(["A"])
+
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(fake_post))
+
+    results = RefMet.validate_metabolite_names(["A", "X", "A", "X"])
+
+    assert calls == [["A", "X"]]
+
+    assert [r.input_name for r in results] == ["A", "X", "A", "X"]
+    assert results[0] is results[2]
+    assert results[1].lm_id is None and results[3].lm_id is None
+
+
+class FakeStreamResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.encoding = None
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def iter_lines(self, chunk_size=512, decode_unicode=False):
+        yield from self.text.splitlines()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.kwargs = None
+
+    def post(self, url, **kwargs):
+        self.kwargs = kwargs
+        return self.response
+
+
+def test_validate_metabolite_names_streams_response(monkeypatch):
+    response = FakeStreamResponse(fake_tsv(["A", "B"]))
+    session = FakeSession(response)
+    monkeypatch.setattr(RefMet, "_SESSION", session)
+
+    results = RefMet.validate_metabolite_names(["A", "B", "C"])
+
+    assert session.kwargs["stream"] is True
+    assert session.kwargs["data"] == {"metabolite_name": "A\nB\nC"}
+    assert [r.lm_id for r in results] == ["LM_A", "LM_B", None]
+    assert response.closed
+
+
+def test_validate_metabolite_names_http_error(monkeypatch):
+    response = FakeStreamResponse("", status_code=503)
+    monkeypatch.setattr(RefMet, "_SESSION", FakeSession(response))
+
+    res = RefMet.validate_metabolite_names(["A"])
+
+    assert "503" in res["error"]
+    assert response.closed
+
+
+def test_validate_metabolite_names_uses_cache(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_post(names):
+        calls.append(list(names))
+        return fake_tsv([n for n in names if n != "Unknown"])
+
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(fake_post))
+    monkeypatch.setattr(RefMet, "CACHE_PATH", str(tmp_path / "refmet.sqlite"))
+
+    first = RefMet.validate_metabolite_names(["A", "B", "Unknown"])
+    second = RefMet.validate_metabolite_names(["B", "A", "C"])
+    third = RefMet.validate_metabolite_names(["A", "B"])
+
+    # Matches are cached; unmatched names are asked again
+    assert calls == [["A", "B", "Unknown"], ["C"]]
+    assert [r.lm_id for r in first] == ["LM_A", "LM_B", None]
+    assert [r.lm_id for r in second] == ["LM_B", "LM_A", "LM_C"]
+    assert [r.model_dump() for r in third] == [r.model_dump() for r in first[:2]]
+
+
+def test_validate_metabolite_names_reuses_results_in_process(monkeypatch):
+    calls = []
+
+    def fake_post(names):
+        calls.append(list(names))
+        return fake_tsv([n for n in names if n != "Unknown"])
+
+    monkeypatch.setattr(RefMet, "_post_names", staticmethod(fake_post))
+
+    first = RefMet.validate_metabolite_names(["A", "Unknown"])
+    first[0].lm_id = "changed"
+    second = RefMet.validate_metabolite_names(["B", "A", "Unknown"])
+
+    assert calls == [["A", "Unknown"], ["B", "Unknown"]]
+    assert [r.lm_id for r in second] == ["LM_B", "LM_A", None]
+
+    RefMet.clear_cache()
+    RefMet.validate_metabolite_names(["A"])
+    assert calls[-1] == ["A"]
+
+
+class Sample:
+    def __init__(self, sample_name):
+        self.sample_name = sample_name
+
+
+def test_attach_results_to_samples_copies_shared_results():
+    shared = RefMetResult(input_name="A", lm_id="LM_A")
+    samples = [Sample("A"), Sample("B"), Sample("A")]
+
+    RefMet.attach_results_to_samples(samples, [shared, RefMetResult(input_name="B"), shared])
+
+    assert samples[0].refmet_result == shared.model_dump()
+    assert samples[1].refmet_result["lm_id"] is None
+    samples[0].refmet_result["lm_id"] = "changed"
+    assert samples[2].refmet_result["lm_id"] == "LM_A"
+
+
+def test_get_lm_ids_and_unmatched_accept_results_and_dicts():
+    samples = [Sample("A"), Sample("B"), Sample("C"), Sample("D"), Sample("E")]
+    samples[0].refmet_result = RefMetResult(lm_id="LM_A", standardized_name="A")
+    samples[1].refmet_result = {"lm_id": "LM_A", "standardized_name": "A"}
+    samples[2].refmet_result = RefMetResult(standardized_name="C")
+    samples[3].refmet_result = {"lm_id": None, "standardized_name": "C"}
+
+    assert RefMet.get_lm_ids(samples) == ["LM_A"]
+    assert RefMet.get_unmatched_results(samples) == ["C"]